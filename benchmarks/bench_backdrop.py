@@ -0,0 +1,92 @@
+"""
+bench_backdrop.py
+
+Compares the per-frame cost of drawing the pipes as filled rects and from the
+cached textured slices, and of blitting the raw background image and the
+pre-scaled Background, still and scrolling. Run from the project root:
+
+    python -m benchmarks.bench_backdrop
+"""
+
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT, SCI_FI_BLUE
+from game.background import Background
+from game.obstacle import Obstacle
+from utils.assets import assets
+from utils.pipe_cache import pipe_cache
+
+FRAMES = 1000
+OBSTACLES = 4  # Obstacles on screen at once during play
+
+
+def time_frames(draw):
+    """
+    Return the milliseconds per frame spent in draw().
+    """
+    draw()  # Fill the caches outside the timed frames
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        draw()
+    return (time.perf_counter() - start) * 1000 / FRAMES
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    rng = random.Random(1)
+    obstacles = [
+        Obstacle(i * 150, top_height=rng.randint(50, 400)) for i in range(OBSTACLES)
+    ]
+
+    def draw_rects():
+        for obstacle in obstacles:
+            pygame.draw.rect(
+                screen,
+                SCI_FI_BLUE,
+                (obstacle.x, 0, obstacle.width, obstacle.top_height),
+            )
+            pygame.draw.rect(
+                screen,
+                SCI_FI_BLUE,
+                (
+                    obstacle.x,
+                    obstacle.bottom_y,
+                    obstacle.width,
+                    SCREEN_HEIGHT - obstacle.bottom_y,
+                ),
+            )
+
+    def draw_pipes():
+        for obstacle in obstacles:
+            obstacle.draw(screen)
+
+    image = assets.image("bg-nebula.png", alpha=False)
+    still = Background(image)
+    scrolling = Background(image, speed=0.2)
+
+    def draw_scrolling():
+        scrolling.update()
+        scrolling.draw(screen)
+
+    cases = [
+        (f"{OBSTACLES} obstacles, rects", draw_rects),
+        (f"{OBSTACLES} obstacles, textured", draw_pipes),
+        ("raw background", lambda: screen.blit(image, (0, 0))),
+        ("scaled background", lambda: still.draw(screen)),
+        ("scrolling background", draw_scrolling),
+    ]
+    print(f"{'':>24} {'ms/frame':>9}")
+    for name, draw in cases:
+        print(f"{name:>24} {time_frames(draw):>9.3f}")
+    print(f"pipe slices cached: {len(pipe_cache)}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
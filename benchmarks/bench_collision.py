@@ -0,0 +1,87 @@
+"""
+bench_collision.py
+
+Compares the cost of collision checks with and without pixel-perfect masks,
+per simulated frame and per check that reaches the narrow phase. Run from the
+project root:
+
+    python -m benchmarks.bench_collision
+"""
+
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from game.bird import Bird
+from game.obstacle import Obstacle
+from game.powerup import PowerUp
+from game.runner import gap_policy
+from game.simulation import Simulation
+from utils.assets import assets
+from utils.profiler import profiler
+
+FRAMES = 20_000
+CHECKS = 100_000
+SECTIONS = ("update.collisions", "update.powerups")
+
+
+def frame_costs(pixel_perfect, frames=FRAMES):
+    """
+    Return the profiler summary of the collision sections over frames of
+    autopilot play, restarting the game whenever it ends, and the number of
+    games played.
+    """
+    Obstacle.PIXEL_PERFECT = PowerUp.PIXEL_PERFECT = pixel_perfect
+    profiler.window = frames
+    profiler.enabled = True
+    profiler.reset()
+    sim = Simulation("medium", seed=1)
+    games = 1
+    for _ in range(frames):
+        if sim.done:
+            sim.reset()
+            games += 1
+        sim.step(gap_policy(sim))
+    profiler.enabled = False
+    summary = profiler.summary()
+    return {name: summary[name] for name in SECTIONS}, games
+
+
+def check_cost(pixel_perfect, checks=CHECKS):
+    """
+    Return the microseconds one obstacle check takes when the bird's rect
+    overlaps the pipe's corner but none of its pixels do.
+    """
+    Obstacle.PIXEL_PERFECT = pixel_perfect
+    bird = Bird(0.5, -9)
+    bird.rect.topleft = (100, 100)
+    obstacle = Obstacle(bird.rect.right - 2, top_height=bird.rect.top + 2)
+    start = time.perf_counter()
+    for _ in range(checks):
+        obstacle.collide(bird)
+    return (time.perf_counter() - start) / checks * 1_000_000
+
+
+def main():
+    # Build the masks up front so the first frames do not pay for it
+    Bird(0.5, -9).mask
+    for kind in PowerUp.TYPES:
+        assets.mask(f"{kind}.png", (PowerUp.width, PowerUp.height))
+
+    print(f"{'':>8} {'section':>18} {'mean us':>9} {'p95 us':>8} {'p99 us':>8}")
+    for label, pixel_perfect in (("rects", False), ("masks", True)):
+        sections, games = frame_costs(pixel_perfect)
+        for name, stats in sections.items():
+            print(
+                f"{label:>8} {name:>18} {stats['mean'] * 1000:>9.2f}"
+                f" {stats['p95'] * 1000:>8.2f} {stats['p99'] * 1000:>8.2f}"
+            )
+        print(f"{label:>8} {games} games in {FRAMES} frames")
+    print()
+    for label, pixel_perfect in (("rects", False), ("masks", True)):
+        print(f"{label:>8} narrow-phase check {check_cost(pixel_perfect):.2f} us")
+
+
+if __name__ == "__main__":
+    main()
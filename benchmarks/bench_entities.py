@@ -0,0 +1,102 @@
+"""
+bench_entities.py
+
+Reports the memory held by each entity type and how fast its update runs.
+Run from the project root:
+
+    python -m benchmarks.bench_entities
+"""
+
+import os
+import random
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from game.bird import Bird
+from game.obstacle import Obstacle
+from game.particle import Particle, ParticleSystem
+from game.powerup import PowerUp
+from game.star import Star, StarField
+
+COUNT = 10_000
+UPDATES = 100
+
+
+def bytes_per_entity(factory, count=COUNT):
+    """
+    Return the average traced allocation per entity built by factory.
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    entities = [factory() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Leave out the list that holds the entities
+    list_size = entities.__sizeof__()
+    return (after - before - list_size) / count, entities
+
+
+def updates_per_second(entities, updates=UPDATES):
+    """
+    Return how many entity updates run per second.
+    """
+    start = time.perf_counter()
+    for _ in range(updates):
+        for entity in entities:
+            entity.update()
+    return len(entities) * updates / (time.perf_counter() - start)
+
+
+def run_system(factory, count=COUNT, updates=UPDATES):
+    """
+    Return bytes per element and element updates per second for a
+    vectorized system holding count elements.
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    system = factory(count)
+    size = (tracemalloc.get_traced_memory()[0] - before) / count
+    tracemalloc.stop()
+    start = time.perf_counter()
+    for _ in range(updates):
+        system.update()
+    return size, count * updates / (time.perf_counter() - start)
+
+
+def make_particles(count):
+    """
+    Return a ParticleSystem filled with count live particles.
+    """
+    particles = ParticleSystem(capacity=count, seed=1)
+    particles.emit((250, 350), count)
+    return particles
+
+
+def main():
+    random.seed(1)
+    entity_types = [
+        ("Bird", lambda: Bird(0.5, -9)),
+        ("Obstacle", lambda: Obstacle(500)),
+        ("PowerUp", lambda: PowerUp(500)),
+        ("Particle", lambda: Particle((250, 350))),
+        ("Star", Star),
+    ]
+    print(f"{'entity':>16} {'bytes/entity':>13} {'updates/s':>13}")
+    for name, factory in entity_types:
+        size, entities = bytes_per_entity(factory)
+        rate = updates_per_second(entities)
+        print(f"{name:>16} {size:>13.1f} {rate:>13,.0f}")
+
+    systems = [
+        ("ParticleSystem", make_particles),
+        ("StarField", lambda count: StarField(count, rng=random.Random(1))),
+    ]
+    for name, factory in systems:
+        size, rate = run_system(factory)
+        print(f"{name:>16} {size:>13.1f} {rate:>13,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+bench_particles.py
+
+Compares per-object Particle instances with the pooled ParticleSystem at
+increasing emission rates. Run from the project root:
+
+    python -m benchmarks.bench_particles
+"""
+
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from game.particle import Particle, ParticleSystem
+
+FRAMES = 300
+WARMUP_FRAMES = 30  # Untimed, so one-off setup such as sprites is left out
+EMISSION_RATES = [1, 10, 100]
+
+
+def run_objects(screen, rate, frames):
+    """
+    Simulate the original list-of-Particle update and draw loop.
+    """
+    particles = []
+    for _ in range(frames):
+        for _ in range(rate):
+            particles.append(Particle((SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)))
+        particles[:] = [p for p in particles if p.life > 0]
+        for particle in particles:
+            particle.update()
+        for particle in particles:
+            particle.draw(screen)
+
+
+def run_pool(screen, rate, frames):
+    """
+    Simulate the same workload with a ParticleSystem.
+    """
+    particles = ParticleSystem(capacity=max(4096, rate * ParticleSystem.LIFE))
+    for _ in range(frames):
+        particles.emit((SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2), rate)
+        particles.update()
+        particles.draw(screen)
+
+
+def main():
+    pygame.init()
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    print(f"{'rate':>6} {'objects ms/frame':>18} {'pool ms/frame':>15}")
+    for rate in EMISSION_RATES:
+        timings = []
+        for runner in (run_objects, run_pool):
+            runner(screen, rate, WARMUP_FRAMES)
+            start = time.perf_counter()
+            runner(screen, rate, FRAMES)
+            timings.append((time.perf_counter() - start) * 1000 / FRAMES)
+        print(f"{rate:>6} {timings[0]:>18.3f} {timings[1]:>15.3f}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+bench_stars.py
+
+Compares per-object Star instances with the pre-rendered StarField at
+increasing star counts. Run from the project root:
+
+    python -m benchmarks.bench_stars
+"""
+
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from game.star import Star, StarField
+
+FRAMES = 200
+STAR_COUNTS = [50, 500, 5000]
+
+
+def run_objects(screen, count):
+    """
+    Update and draw count Star objects every frame.
+    """
+    stars = [Star() for _ in range(count)]
+    for _ in range(FRAMES):
+        for star in stars:
+            star.update()
+        for star in stars:
+            star.draw(screen)
+
+
+def run_field(screen, count):
+    """
+    Update and draw a StarField of the same size every frame.
+    """
+    stars = StarField(count)
+    stars.draw(screen)  # Pre-render the layers outside the timed frames
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        stars.update()
+        stars.draw(screen)
+    return start
+
+
+def main():
+    pygame.init()
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    print(f"{'stars':>6} {'objects ms/frame':>18} {'field ms/frame':>16}")
+    for count in STAR_COUNTS:
+        start = time.perf_counter()
+        run_objects(screen, count)
+        objects_ms = (time.perf_counter() - start) * 1000 / FRAMES
+        start = run_field(screen, count)
+        field_ms = (time.perf_counter() - start) * 1000 / FRAMES
+        print(f"{count:>6} {objects_ms:>18.3f} {field_ms:>16.3f}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+bench_startup.py
+
+Measures how long the game takes to import and to show its first frame,
+each run in a fresh interpreter. Run from the project root:
+
+    python -m benchmarks.bench_startup
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+RUNS = 5
+
+# Runs the game until its first frame reaches the display, then reports the
+# seconds spent importing main and reaching that frame. Scores are saved in
+# the directory given as its argument rather than in the checkout.
+FIRST_FRAME_SCRIPT = """
+import os, sys, time
+start = time.perf_counter()
+import pygame
+import main
+imported = time.perf_counter()
+
+from utils.high_score import score_store
+score_store.path = os.path.join(sys.argv[1], "scores.db")
+score_store.high_score_path = os.path.join(sys.argv[1], "high_score.txt")
+
+def first_frame(*args):
+    print(imported - start, time.perf_counter() - start, flush=True)
+    os._exit(0)
+
+pygame.display.flip = pygame.display.update = first_frame
+main.main()
+"""
+
+
+def run_once():
+    """
+    Return (import, first frame, process) times in milliseconds.
+    """
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy")
+    with tempfile.TemporaryDirectory() as save_dir:
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-c", FIRST_FRAME_SCRIPT, save_dir],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        process_time = time.perf_counter() - start
+    import_time, first_frame_time = map(float, result.stdout.split()[-2:])
+    return import_time * 1000, first_frame_time * 1000, process_time * 1000
+
+
+def main():
+    runs = [run_once() for _ in range(RUNS)]
+    print(f"{'':>12} {'median ms':>10} {'min ms':>8}")
+    for name, times in zip(("import", "first frame", "process"), zip(*runs)):
+        print(f"{name:>12} {statistics.median(times):>10.1f} {min(times):>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
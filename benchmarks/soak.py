@@ -0,0 +1,141 @@
+"""
+soak.py
+
+Plays a long session with the autopilot at the controls, updating and
+drawing every frame as the game does, and reports memory and frame times
+window by window. Exits with status 1 if memory keeps growing. Run from the
+project root:
+
+    python -m benchmarks.soak --frames 100000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from config.settings import (
+    SCREEN_WIDTH,
+    SCREEN_HEIGHT,
+    STAR_COUNT,
+    DIFFICULTY_LEVELS,
+    PROFILES,
+)
+from game.autopilot import should_flap
+from game.background import Backgrounds
+from game.bird import Bird
+from game.course import next_course
+from game.obstacle import Obstacle
+from game.particle import ParticleSystem
+from game.pool import EntityPool
+from game.powerup import PowerUp
+from game.star import StarField
+from game.state import GameState, STATE_PLAYING
+from utils.audio import NullAudio
+from utils.helpers import update_game, draw_game
+from utils.renderer import FullRenderer
+from utils.telemetry import memory_kb
+
+FRAMES = 60_000
+WINDOW = 6_000  # Frames per reported window
+GAME_FRAMES = 1_200  # A game the autopilot survives is ended after this
+MAX_GROWTH_KB = 1024  # Allowed growth over the second half of the session
+
+
+def percentile(samples, percent):
+    """
+    Return the percent percentile of samples, in milliseconds.
+    """
+    samples = sorted(samples)
+    return samples[round(percent / 100 * (len(samples) - 1))] * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Soak-test memory and frame times with the autopilot playing."
+    )
+    parser.add_argument("--frames", type=int, default=FRAMES)
+    parser.add_argument("--level", default="hard", choices=list(DIFFICULTY_LEVELS))
+    parser.add_argument("--theme", default="nebula", choices=list(PROFILES.themes))
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    renderer = FullRenderer()
+    audio = NullAudio()
+    rng = random.Random(args.seed)
+    difficulty = DIFFICULTY_LEVELS[args.level]
+    backgrounds = Backgrounds(PROFILES.themes)
+    obstacles = EntityPool(lambda: Obstacle(SCREEN_WIDTH))
+    powerups = EntityPool(lambda: PowerUp(SCREEN_WIDTH))
+    particles = ParticleSystem(seed=args.seed)
+    game_state = GameState(
+        STATE_PLAYING, args.level, difficulty.gravity, difficulty.flap_strength
+    )
+
+    def new_game():
+        # Start over the way the game loop does after a retry
+        obstacles.clear()
+        powerups.clear()
+        particles.clear()
+        game_state.new_game()
+        game_state.state = STATE_PLAYING
+        game_state.level = args.level
+        game_state.theme = args.theme
+        game_state.current_background = backgrounds[args.theme]
+        game_state.start_time = pygame.time.get_ticks()
+        return Bird(difficulty.gravity, difficulty.flap_strength), next_course(rng)
+
+    bird, course = new_game()
+    stars = StarField(STAR_COUNT)
+    games = 1
+    game_start = 0
+    frame_times = []
+    windows = []
+    print(f"{'frames':>8} {'games':>6} {'memory KB':>10} {'p50 ms':>7} {'p99 ms':>7}")
+    for frame in range(1, args.frames + 1):
+        if game_state.state != STATE_PLAYING or frame - game_start > GAME_FRAMES:
+            bird, course = new_game()
+            games += 1
+            game_start = frame
+
+        start = time.perf_counter()
+        if should_flap(bird, obstacles):
+            bird.flap()
+        game_state.frame_count += 1
+        update_game(
+            bird, obstacles, stars, game_state, particles, powerups, audio, course
+        )
+        draw_game(
+            screen, bird, obstacles, stars, game_state, particles, powerups, renderer
+        )
+        frame_times.append(time.perf_counter() - start)
+
+        if frame % WINDOW == 0:
+            memory = memory_kb()
+            windows.append(memory)
+            print(
+                f"{frame:>8} {games:>6} {memory:>10} "
+                f"{percentile(frame_times, 50):>7.3f} {percentile(frame_times, 99):>7.3f}"
+            )
+            frame_times = []
+    pygame.quit()
+
+    # Caches fill during the first half; after that memory should hold still
+    if len(windows) >= 2:
+        settled = windows[len(windows) // 2 - 1]
+        growth = windows[-1] - settled
+        print(f"memory growth over the second half: {growth} KB")
+        if growth > MAX_GROWTH_KB:
+            print("FAIL: memory grows over a long session")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
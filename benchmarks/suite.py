@@ -0,0 +1,272 @@
+"""
+suite.py
+
+Runs the release benchmarks (frame time on synthetic scenes of increasing
+size, startup and asset loading) and records them as JSON, or compares two
+recordings and flags regressions. Run from the project root:
+
+    python -m benchmarks.suite run --output results.json
+    python -m benchmarks.suite compare baseline.json results.json --budget-ms 16.7
+
+compare exits with status 1 when a benchmark got slower than the threshold
+allows or a scene's frame time is over budget.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from config.settings import (
+    SCREEN_WIDTH,
+    SCREEN_HEIGHT,
+    SHIELD_DURATION,
+    SOUND_EFFECTS,
+    PROFILES,
+)
+from game.background import Backgrounds
+from game.bird import Bird
+from game.course import next_course
+from game.obstacle import Obstacle
+from game.particle import ParticleSystem
+from game.pool import EntityPool
+from game.powerup import PowerUp
+from game.star import StarField
+from game.state import GameState, STATE_PLAYING
+from utils.assets import AssetManager
+from utils.audio import NullAudio
+from utils.helpers import update_game, draw_game
+from utils.profiler import PERCENTILES
+from utils.renderer import FullRenderer
+from benchmarks import bench_startup
+
+FRAMES = 300
+WARMUP_FRAMES = 30
+STARTUP_RUNS = 5
+THEME = "nebula"
+
+# Entities on screen in each synthetic scene. Particles are the number alive
+# at once.
+SCENES = {
+    "small": {"obstacles": 4, "powerups": 1, "particles": 20, "stars": 50},
+    "medium": {"obstacles": 8, "powerups": 4, "particles": 200, "stars": 500},
+    "large": {"obstacles": 16, "powerups": 16, "particles": 2000, "stars": 5000},
+}
+
+
+def summarize(samples) -> dict:
+    """
+    Return the mean and percentiles of samples (in seconds) in milliseconds.
+    """
+    samples = sorted(samples)
+    stats = {"mean": sum(samples) / len(samples) * 1000}
+    for percentile in PERCENTILES:
+        index = round(percentile / 100 * (len(samples) - 1))
+        stats[f"p{percentile}"] = samples[index] * 1000
+    return stats
+
+
+def top_up(pool, count, spacing, make):
+    """
+    Spawn entities at the right of pool until it holds count, keeping it
+    sorted by x.
+    """
+    while len(pool) < count:
+        x = pool[-1].x + spacing if pool else SCREEN_WIDTH
+        make(pool.spawn(), x)
+
+
+def run_scene(screen, size, frames=FRAMES, seed=1):
+    """
+    Drive update_game and draw_game over a scene of the given size and
+    return the update, draw and whole frame timings.
+    """
+    rng = random.Random(seed)
+    course = next_course(rng)
+    bird = Bird(0.5, -9)
+    obstacles = EntityPool(lambda: Obstacle(SCREEN_WIDTH))
+    powerups = EntityPool(lambda: PowerUp(SCREEN_WIDTH))
+    stars = StarField(size["stars"], rng=random.Random(seed))
+    particles = ParticleSystem(capacity=max(4096, size["particles"]), seed=seed)
+    game_state = GameState(STATE_PLAYING, "medium")
+    game_state.theme = THEME
+    game_state.current_background = Backgrounds(PROFILES.themes)[THEME]
+    game_state.start_time = 0
+    audio = NullAudio()
+    renderer = FullRenderer()
+
+    obstacle_spacing = (SCREEN_WIDTH + Obstacle.width) / size["obstacles"]
+    powerup_spacing = (SCREEN_WIDTH + PowerUp.width) / size["powerups"]
+
+    def place_obstacle(obstacle, x):
+        obstacle.reset(x, rng.randint(50, SCREEN_HEIGHT - Obstacle.GAP - 50))
+
+    def place_powerup(powerup, x):
+        powerup.reset(x, rng.randint(50, SCREEN_HEIGHT - 50), rng.choice(PowerUp.TYPES))
+
+    emit_count = max(1, size["particles"] // ParticleSystem.LIFE)
+    update_times, draw_times, frame_times = [], [], []
+    for frame in range(WARMUP_FRAMES + frames):
+        # Hold the shielded bird still so the scene never ends
+        bird.y, bird.velocity = SCREEN_HEIGHT // 2, 0
+        bird.shield, bird.shield_timer = True, SHIELD_DURATION
+        top_up(obstacles, size["obstacles"], obstacle_spacing, place_obstacle)
+        top_up(powerups, size["powerups"], powerup_spacing, place_powerup)
+        particles.emit((SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2), emit_count)
+
+        start = time.perf_counter()
+        game_state.frame_count += 1
+        update_game(
+            bird, obstacles, stars, game_state, particles, powerups, audio, course
+        )
+        updated = time.perf_counter()
+        draw_game(
+            screen, bird, obstacles, stars, game_state, particles, powerups, renderer
+        )
+        end = time.perf_counter()
+        if frame >= WARMUP_FRAMES:
+            update_times.append(updated - start)
+            draw_times.append(end - updated)
+            frame_times.append(end - start)
+    return update_times, draw_times, frame_times
+
+
+def load_assets(manager):
+    """
+    Load every image and sound the game uses with manager, and return the
+    seconds spent on images and on sounds.
+    """
+    images = [
+        "phoenix.png",
+        *(f"{kind}.png" for kind in PowerUp.TYPES),
+        *filter(None, (theme.background for theme in PROFILES.themes.values())),
+    ]
+    start = time.perf_counter()
+    for name in images:
+        manager.image(name)
+    images_done = time.perf_counter()
+    if pygame.mixer.get_init():
+        for effect in SOUND_EFFECTS.values():
+            manager.sound(effect["file"])
+    return images_done - start, time.perf_counter() - images_done
+
+
+def run(frames=FRAMES, startup_runs=STARTUP_RUNS) -> dict:
+    """
+    Run every benchmark and return {"meta": ..., "results": {name: stats}}.
+    """
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    results = {}
+    for name, size in SCENES.items():
+        timings = run_scene(screen, size, frames)
+        for part, samples in zip(("update", "draw", "total"), timings):
+            results[f"frame.{name}.{part}"] = summarize(samples)
+        print(f"{name:>8} scene  {results[f'frame.{name}.total']['p50']:.3f} ms/frame")
+
+    loads = [load_assets(AssetManager()) for _ in range(startup_runs)]
+    results["assets.images"] = summarize([images for images, _ in loads])
+    results["assets.sounds"] = summarize([sounds for _, sounds in loads])
+    pygame.quit()
+
+    # Startup runs in fresh interpreters, so nothing above is cached
+    runs = [bench_startup.run_once() for _ in range(startup_runs)]
+    for name, times in zip(("import", "first_frame"), zip(*runs)):
+        results[f"startup.{name}"] = summarize([t / 1000 for t in times])
+    print(f" startup  {results['startup.first_frame']['p50']:.1f} ms to first frame")
+
+    meta = {
+        "recorded": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "platform": platform.platform(),
+        "frames": frames,
+        "startup_runs": startup_runs,
+    }
+    return {"meta": meta, "results": results}
+
+
+def compare(baseline, current, metric="p50", threshold=10.0, budget_ms=None):
+    """
+    Print each benchmark's change from baseline to current and return the
+    names of those that regressed: slower by more than threshold percent,
+    or, for whole frames, over budget_ms at p95.
+    """
+    regressions = []
+    print(f"{'benchmark':<24} {'before':>9} {'after':>9} {'change':>8}")
+    for name, stats in current["results"].items():
+        before = baseline["results"].get(name)
+        after = stats[metric]
+        flags = []
+        if before is None:
+            change = "new"
+        else:
+            before = before[metric]
+            percent = (after - before) / before * 100 if before else 0.0
+            change = f"{percent:+.1f}%"
+            if percent > threshold:
+                flags.append("REGRESSION")
+        if (
+            budget_ms is not None
+            and name.endswith(".total")
+            and stats["p95"] > budget_ms
+        ):
+            flags.append(f"OVER BUDGET (p95 {stats['p95']:.2f} ms)")
+        if flags:
+            regressions.append(name)
+        before_text = "-" if before is None else f"{before:.3f}"
+        print(
+            f"{name:<24} {before_text:>9} {after:>9.3f} {change:>8} {' '.join(flags)}"
+        )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run the benchmark suite or compare two of its recordings."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="run the suite and save JSON")
+    run_parser.add_argument("--output", default="benchmark-results.json")
+    run_parser.add_argument("--frames", type=int, default=FRAMES)
+    run_parser.add_argument("--startup-runs", type=int, default=STARTUP_RUNS)
+    compare_parser = commands.add_parser("compare", help="flag regressions")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--metric", default="p50", help="mean, p50, p95, p99")
+    compare_parser.add_argument(
+        "--threshold", type=float, default=10.0, help="allowed slowdown in percent"
+    )
+    compare_parser.add_argument(
+        "--budget-ms", type=float, help="maximum p95 time of a whole frame"
+    )
+    args = parser.parse_args()
+
+    if args.command == "run":
+        recording = run(args.frames, args.startup_runs)
+        with open(args.output, "w") as file:
+            json.dump(recording, file, indent=2)
+        print(f"saved {args.output}")
+    else:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        with open(args.current) as file:
+            current = json.load(file)
+        regressions = compare(
+            baseline, current, args.metric, args.threshold, args.budget_ms
+        )
+        if regressions:
+            print(f"{len(regressions)} regressed: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
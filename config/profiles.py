@@ -0,0 +1,148 @@
+"""
+profiles.py
+
+Loads and validates the difficulty and theme profiles in profiles.json.
+"""
+
+import json
+import os
+from types import MappingProxyType
+from typing import NamedTuple, Optional
+
+PROFILES_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "profiles.json"
+)
+
+
+class Difficulty(NamedTuple):
+    """
+    The bird physics of one difficulty level, chosen with key.
+    """
+
+    name: str
+    key: str
+    gravity: float
+    flap_strength: float
+
+
+class Theme(NamedTuple):
+    """
+    The look of one theme, chosen with key. background is an image file
+    name, or None for a plain black background. scroll_speed is in pixels
+    per frame, converted from pixels per second in the file, and pipe_color
+    is an (r, g, b) tuple.
+    """
+
+    name: str
+    key: str
+    star_count: int
+    background: Optional[str]
+    scroll_speed: float
+    pipe_color: tuple
+
+
+class Timings(NamedTuple):
+    """
+    Game timings, converted from seconds in the file to simulation frames.
+    """
+
+    obstacle_spawn_interval: int
+    powerup_spawn_interval: int
+    shield_duration: int
+
+
+class Profiles(NamedTuple):
+    """
+    Every profile in the file. difficulties and themes are read-only
+    mappings from name to profile, in file order.
+    """
+
+    timings: Timings
+    difficulties: MappingProxyType
+    themes: MappingProxyType
+
+
+def load_profiles(path: str = PROFILES_FILE, fps: int = 60) -> Profiles:
+    """
+    Load the profiles from path, converting timings to frames at fps.
+    Raises ValueError describing the first invalid entry.
+    """
+    with open(path, "r") as file:
+        data = json.load(file)
+
+    def require(condition, message):
+        if not condition:
+            raise ValueError(f"{path}: {message}")
+
+    timings = data.get("timings", {})
+    frames = {}
+    for field in ("obstacle_spawn", "powerup_spawn", "shield"):
+        seconds = timings.get(f"{field}_seconds")
+        require(
+            isinstance(seconds, (int, float)) and seconds > 0,
+            f"timings.{field}_seconds must be a positive number",
+        )
+        frames[field] = max(1, round(seconds * fps))
+
+    keys = set()
+
+    def require_key(section, name, entry):
+        key = entry.get("key")
+        require(
+            isinstance(key, str) and len(key) == 1 and key not in keys,
+            f"{section}.{name}.key must be a single unused character",
+        )
+        keys.add(key)
+        return key
+
+    difficulties = {}
+    for name, entry in data.get("difficulties", {}).items():
+        key = require_key("difficulties", name, entry)
+        gravity = entry.get("gravity")
+        flap_strength = entry.get("flap_strength")
+        require(
+            isinstance(gravity, (int, float)) and gravity > 0,
+            f"difficulties.{name}.gravity must be a positive number",
+        )
+        require(
+            isinstance(flap_strength, (int, float)) and flap_strength < 0,
+            f"difficulties.{name}.flap_strength must be a negative number",
+        )
+        difficulties[name] = Difficulty(name, key, gravity, flap_strength)
+    require(difficulties, "no difficulties defined")
+
+    themes = {}
+    for name, entry in data.get("themes", {}).items():
+        key = require_key("themes", name, entry)
+        star_count = entry.get("star_count")
+        background = entry.get("background")
+        require(
+            isinstance(star_count, int) and star_count >= 0,
+            f"themes.{name}.star_count must be a non-negative integer",
+        )
+        require(
+            background is None or isinstance(background, str),
+            f"themes.{name}.background must be a file name or null",
+        )
+        scroll_speed = entry.get("scroll_speed")
+        require(
+            isinstance(scroll_speed, (int, float)) and scroll_speed >= 0,
+            f"themes.{name}.scroll_speed must be a non-negative number",
+        )
+        pipe_color = entry.get("pipe_color")
+        require(
+            isinstance(pipe_color, list)
+            and len(pipe_color) == 3
+            and all(isinstance(c, int) and 0 <= c <= 255 for c in pipe_color),
+            f"themes.{name}.pipe_color must be three integers from 0 to 255",
+        )
+        themes[name] = Theme(
+            name, key, star_count, background, scroll_speed / fps, tuple(pipe_color)
+        )
+    require(themes, "no themes defined")
+
+    return Profiles(
+        Timings(frames["obstacle_spawn"], frames["powerup_spawn"], frames["shield"]),
+        MappingProxyType(difficulties),
+        MappingProxyType(themes),
+    )
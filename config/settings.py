@@ -4,14 +4,28 @@ settings.py
 Contains configuration constants for the game.
 """
 
-import pygame
+from config.profiles import load_profiles
 
 # Screen dimensions
 SCREEN_WIDTH = 500
 SCREEN_HEIGHT = 700
 
-# Themes
-THEMES = ["space", "nebula", "planet"]
+# Frame rate. The simulation always steps FPS times per second; rendering
+# is capped at RENDER_FPS (0 runs uncapped) and interpolates between steps.
+FPS = 60
+RENDER_FPS = 144
+MAX_SIM_STEPS_PER_FRAME = 5  # Drop the backlog beyond this many steps a frame
+SHOW_FRAME_STATS = False  # Toggle in game with F3
+
+# Difficulty and theme profiles and timings, from config/profiles.json
+PROFILES = load_profiles(fps=FPS)
+DIFFICULTY_LEVELS = PROFILES.difficulties
+THEMES = tuple(PROFILES.themes)
+
+# Star field density on the start screen and per theme
+STAR_COUNT = 50
+THEME_STAR_COUNTS = {name: theme.star_count for name, theme in PROFILES.themes.items()}
+STAR_LAYERS = 3
 
 # Colors
 WHITE = (255, 255, 255)
@@ -23,11 +37,64 @@ SCI_FI_GREEN = (0, 255, 100)
 OBSTACLE_GAP = 200
 OBSTACLE_WIDTH = 80
 OBSTACLE_VELOCITY = -5
+OBSTACLE_SPAWN_INTERVAL = PROFILES.timings.obstacle_spawn_interval  # Frames
+POWERUP_SPAWN_INTERVAL = PROFILES.timings.powerup_spawn_interval  # Frames
+SHIELD_DURATION = PROFILES.timings.shield_duration  # Frames
 
-# Fonts
-pygame.font.init()
-FONT = pygame.font.SysFont("Arial", 40)
-FONT_SMALL = pygame.font.SysFont("Arial", 24)
+# Collisions are tested against the sprites' pixels once their bounding
+# boxes overlap. Sprites saved without transparency have their background
+# (colours within MASK_THRESHOLD of the corner pixel) left out.
+PIXEL_PERFECT_COLLISION = True
+MASK_THRESHOLD = 32
 
-# Frame rate
-FPS = 60
+# The autopilot flying the attract-mode demo behind the menus
+ATTRACT_MODE = True
+ATTRACT_LEVEL = "medium"
+ATTRACT_DELAY = 60  # Frames on the menus before the demo starts
+AUTOPILOT_HORIZON = 30  # Frames simulated ahead
+AUTOPILOT_MARGIN = 6  # Pixels kept clear of pipes and screen edges
+
+# Textured pipe slices kept per theme colour and height
+PIPE_CACHE_SIZE = 64
+
+# Course generation. Each chunk of obstacles narrows the gap a little, down
+# to a floor relative to the starting gap, and gaps never jump further than
+# the bird can follow.
+COURSE_CHUNK_SIZE = 16  # Obstacles per generated chunk
+COURSE_MIN_GAP_RATIO = 0.75  # Narrowest gap as a fraction of the starting gap
+COURSE_GAP_STEP = 5  # Gap narrowing per chunk
+COURSE_MAX_SHIFT = 250  # Largest move of the gap between two obstacles
+COURSE_LOOKAHEAD_CHUNKS = 1  # Chunks generated ahead of the current one
+COURSE_CACHE_SIZE = 32  # Seeded courses kept in memory
+
+# Sound effects: file, mixer channels reserved for it, and the shortest time
+# between two plays (plays sooner than that are dropped)
+SOUND_EFFECTS = {
+    "flap": {"file": "flap.mp3", "channels": 2, "min_interval_ms": 80},
+    "score": {"file": "score.mp3", "channels": 1, "min_interval_ms": 50},
+    "game_over": {"file": "game_over.mp3", "channels": 1, "min_interval_ms": 0},
+}
+
+# Fonts, loaded on first use through utils.assets
+FONT_NAME = "Arial"
+FONT_SIZE = 40
+FONT_SMALL_SIZE = 24
+
+# Scores kept on each theme and difficulty leaderboard
+LEADERBOARD_SIZE = 10
+
+# Seed for obstacles and power-ups; None picks a new one each run
+RNG_SEED = None
+
+# Update only the changed screen regions instead of flipping the whole
+# display each frame. Saves fill-rate on slow hardware; the star field is
+# drawn still in this mode.
+DIRTY_RECT_RENDERING = False
+
+# Telemetry for long unattended sessions, written to rotating gzip logs in
+# TELEMETRY_DIR (or the directory given with --telemetry); None turns it off
+TELEMETRY_DIR = None
+TELEMETRY_INTERVAL = 600  # Frames per sample
+TELEMETRY_BUFFER = 256  # Records queued for the writer before the oldest drop
+TELEMETRY_FILE_BYTES = 1_000_000  # Uncompressed bytes per log file
+TELEMETRY_MAX_FILES = 50  # Oldest logs beyond this are deleted
@@ -0,0 +1,50 @@
+"""
+attract.py
+
+Defines the AttractMode demo game played behind the menus.
+"""
+
+from config.settings import ATTRACT_LEVEL, ATTRACT_DELAY
+from game.autopilot import autopilot_policy
+from game.particle import ParticleSystem
+from game.simulation import Simulation
+
+
+class AttractMode:
+    """
+    A demo game flown by the autopilot behind the title and difficulty
+    menus. It has its own course and particles, makes no sound, and starts
+    over whenever the autopilot crashes. It waits delay frames before it
+    starts, so it adds nothing to the first frames after launch.
+    """
+
+    def __init__(
+        self, level: str = ATTRACT_LEVEL, seed=None, delay: int = ATTRACT_DELAY
+    ) -> None:
+        self.sim = Simulation(level, seed=seed)
+        self.particles = ParticleSystem(seed=seed)
+        self.sim.particles = self.particles
+        self.delay = delay
+        self.games = 1
+
+    @property
+    def started(self) -> bool:
+        """
+        Whether the demo has started playing.
+        """
+        return self.delay <= 0
+
+    def step(self) -> None:
+        """
+        Advance the demo by one frame, restarting it after a crash.
+        """
+        if self.delay > 0:
+            self.delay -= 1
+            return
+        sim = self.sim
+        if sim.done:
+            sim.reset()
+            self.particles.clear()
+            sim.particles = self.particles
+            self.games += 1
+        sim.step(autopilot_policy(sim))
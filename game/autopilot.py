@@ -0,0 +1,72 @@
+"""
+autopilot.py
+
+A predictive autopilot that plays the game by simulating the bird's flight
+a few frames ahead.
+"""
+
+from config.settings import SCREEN_HEIGHT, AUTOPILOT_HORIZON, AUTOPILOT_MARGIN
+
+
+def gap_at(bird, obstacles, frame):
+    """
+    Return the (top, bottom) bounds of the bird's centre in frame frames:
+    inside the gap of the first obstacle it has not cleared by then, kept
+    AUTOPILOT_MARGIN pixels from the pipes. With no obstacle ahead the bird
+    holds to the middle of the screen.
+    """
+    half = bird.height // 2 + AUTOPILOT_MARGIN
+    left = bird.x - bird.width // 2
+    for obstacle in obstacles:
+        if obstacle.x + obstacle.velocity * frame + obstacle.width > left:
+            return obstacle.top_height + half, obstacle.bottom_y - half
+    return SCREEN_HEIGHT // 2 - half * 2, SCREEN_HEIGHT // 2 + half * 2
+
+
+def hits_top(bird, obstacles, horizon):
+    """
+    Whether a flap now would carry the bird above its gap within horizon
+    frames, following Bird.update.
+    """
+    y, velocity = bird.y, bird.flap_strength
+    for frame in range(1, horizon + 1):
+        velocity += bird.gravity
+        y += velocity
+        if velocity >= 0:
+            return False  # Past the top of the arc
+        if y < gap_at(bird, obstacles, frame)[0]:
+            return True
+    return False
+
+
+def should_flap(bird, obstacles, horizon: int = AUTOPILOT_HORIZON) -> bool:
+    """
+    Decide whether the bird should flap this frame. A flap commits the bird
+    to a fixed arc, so it flaps as late as it can: when gliding one more
+    frame would take it below the gap ahead. It holds off if the arc would
+    then carry it into the pipe above, unless gliding would crash outright.
+    Only the two obstacles not yet behind the bird are considered;
+    obstacles must be sorted by x.
+    """
+    left = bird.x - bird.width // 2
+    ahead = []
+    for obstacle in obstacles:
+        if obstacle.x + obstacle.width > left:
+            ahead.append(obstacle)
+            if len(ahead) == 2:
+                break
+
+    y = bird.y + bird.velocity + bird.gravity
+    top, bottom = gap_at(bird, ahead, 1)
+    if y <= bottom:
+        return False
+    if y > bottom + AUTOPILOT_MARGIN or y > SCREEN_HEIGHT - AUTOPILOT_MARGIN:
+        return True
+    return not hits_top(bird, ahead, horizon)
+
+
+def autopilot_policy(sim) -> bool:
+    """
+    A Simulation policy flapping when should_flap says so.
+    """
+    return should_flap(sim.bird, sim.obstacles)
@@ -0,0 +1,74 @@
+"""
+background.py
+
+Defines the Background class for the theme backdrops.
+"""
+
+import math
+import pygame
+from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from utils.assets import assets
+
+
+class Background:
+    """
+    A theme's backdrop image, scaled once to cover the screen.
+
+    A scrolling background moves left by speed pixels per frame. Its image is
+    tiled with a mirrored copy so the seam between tiles is invisible, and it
+    is drawn with at most two blits.
+    """
+
+    def __init__(self, image, speed: float = 0.0) -> None:
+        self.speed = speed
+        self.offset = 0.0
+        width, height = image.get_size()
+        scale = max(SCREEN_WIDTH / width, SCREEN_HEIGHT / height)
+        size = (math.ceil(width * scale), math.ceil(height * scale))
+        image = pygame.transform.smoothscale(image, size)
+        if speed:
+            tile = pygame.Surface((size[0] * 2, size[1]))
+            tile.blit(image, (0, 0))
+            tile.blit(pygame.transform.flip(image, True, False), (size[0], 0))
+            image = tile
+        if pygame.display.get_surface() is not None:
+            image = image.convert()
+        self.image = image
+        self.width = image.get_width()
+
+    def update(self):
+        """
+        Scroll by one frame.
+        """
+        if self.speed:
+            self.offset = (self.offset + self.speed) % self.width
+
+    def draw(self, screen, alpha=1.0):
+        """
+        Draw the background on the screen. alpha interpolates between the
+        previous (0) and current (1) scroll offsets.
+        """
+        x = -int((self.offset + self.speed * (alpha - 1)) % self.width)
+        screen.blit(self.image, (x, 0))
+        if x + self.width < SCREEN_WIDTH:
+            screen.blit(self.image, (x + self.width, 0))
+
+
+class Backgrounds(dict):
+    """
+    The Background of each theme by name, built on first lookup from the
+    theme's image. Themes without an image map to None.
+    """
+
+    def __init__(self, themes) -> None:
+        super().__init__()
+        self.themes = themes
+
+    def __missing__(self, name):
+        theme = self.themes[name]
+        background = None
+        if theme.background is not None:
+            image = assets.image(theme.background, alpha=False)
+            background = Background(image, theme.scroll_speed)
+        self[name] = background
+        return background
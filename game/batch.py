@@ -0,0 +1,188 @@
+"""
+batch.py
+
+Simulates many birds against one shared obstacle stream, with the birds held
+in NumPy arrays, behind a gym-style reset()/step(actions) interface.
+"""
+
+import random
+import numpy as np
+from config.settings import (
+    SCREEN_WIDTH,
+    SCREEN_HEIGHT,
+    OBSTACLE_SPAWN_INTERVAL,
+    DIFFICULTY_LEVELS,
+)
+from game.bird import Bird
+from game.course import next_course
+from game.obstacle import Obstacle
+from game.pool import EntityPool
+from utils.assets import assets
+
+# Bird geometry, shared with game.bird.Bird
+BIRD_X = Bird.x
+BIRD_START_Y = SCREEN_HEIGHT // 2
+BIRD_WIDTH = Bird.width
+BIRD_HEIGHT = Bird.height
+
+# Columns of the observation array returned by reset() and step()
+OBSERVATION_FIELDS = (
+    "y",
+    "velocity",
+    "next_obstacle_dx",
+    "next_gap_top",
+    "next_gap_bottom",
+)
+
+
+def bird_mask_rows():
+    """
+    Return the first and last opaque row of each column of the bird's
+    collision mask, as arrays. Empty columns get BIRD_HEIGHT and -1, so they
+    never reach a pipe.
+    """
+    mask = assets.mask("phoenix.png", (BIRD_WIDTH, BIRD_HEIGHT))
+    first_rows = np.full(BIRD_WIDTH, BIRD_HEIGHT)
+    last_rows = np.full(BIRD_WIDTH, -1)
+    for x in range(BIRD_WIDTH):
+        rows = [y for y in range(BIRD_HEIGHT) if mask.get_at((x, y))]
+        if rows:
+            first_rows[x], last_rows[x] = rows[0], rows[-1]
+    return first_rows, last_rows
+
+
+class BatchSimulation:
+    """
+    Runs num_birds birds through the same obstacles in lockstep.
+
+    The rules match game.simulation.step_world for gravity, flapping, pipe
+    collisions, scoring and the screen bounds; power-ups are left out. Dead
+    birds stay where they died until the next reset(). Each step's reward is
+    the points a bird scored during it.
+    """
+
+    def __init__(self, num_birds: int, level: str = "medium", seed=None) -> None:
+        self.num_birds = num_birds
+        self.level = level
+        self.rng = random.Random(seed)
+        difficulty = DIFFICULTY_LEVELS[level]
+        self.gravity = difficulty.gravity
+        self.flap_strength = difficulty.flap_strength
+        self.y = np.empty(num_birds)
+        self.velocity = np.empty(num_birds)
+        self.alive = np.empty(num_birds, dtype=bool)
+        self.scores = np.empty(num_birds, dtype=np.int64)
+        self.frames_survived = np.empty(num_birds, dtype=np.int64)
+        self.obstacles = EntityPool(lambda: Obstacle(SCREEN_WIDTH))
+        self.course = None
+        self.frame_count = 0
+        self.mask_rows = bird_mask_rows() if Obstacle.PIXEL_PERFECT else None
+
+    def reset(self):
+        """
+        Start a new episode (on the next course from the seeded stream) and
+        return the first observations.
+        """
+        self.y.fill(BIRD_START_Y)
+        self.velocity.fill(0)
+        self.alive.fill(True)
+        self.scores.fill(0)
+        self.frames_survived.fill(0)
+        self.course = next_course(self.rng)
+        self.obstacles.clear()
+        self.frame_count = 0
+        return self.observe()
+
+    @property
+    def done(self) -> bool:
+        """
+        Whether every bird has died.
+        """
+        return not self.alive.any()
+
+    def step(self, actions):
+        """
+        Advance one frame. actions holds one flap flag per bird. Returns
+        (observations, rewards, dones, info) like a gym vector environment.
+        """
+        self.frame_count += 1
+        alive = self.alive.copy()
+
+        # Flap, then apply gravity to the living birds
+        flap = np.asarray(actions, dtype=bool) & alive
+        self.velocity[flap] = self.flap_strength
+        self.velocity[alive] += self.gravity
+        self.y[alive] += self.velocity[alive]
+        self.frames_survived[alive] += 1
+
+        # Spawn, move and drop obstacles
+        if self.frame_count % OBSTACLE_SPAWN_INTERVAL == 0:
+            gap_top, gap, _ = self.course.next_obstacle()
+            self.obstacles.spawn().reset(SCREEN_WIDTH, gap_top, gap)
+        for obstacle in self.obstacles:
+            obstacle.update()
+        while self.obstacles and self.obstacles[0].x + self.obstacles[0].width <= 0:
+            self.obstacles.despawn_first()
+
+        # Pipe collisions, using the bird rect the way pygame.Rect rounds it
+        center_y = np.trunc(self.y + np.copysign(0.5, self.y))
+        top = center_y - BIRD_HEIGHT // 2
+        bottom = top + BIRD_HEIGHT
+        bird_left = BIRD_X - BIRD_WIDTH // 2
+        hit = np.zeros(self.num_birds, dtype=bool)
+        for obstacle in self.obstacles:
+            if obstacle.x >= bird_left + BIRD_WIDTH:
+                break
+            if obstacle.x + obstacle.width <= bird_left:
+                continue
+            hit_top = (top < obstacle.top_height) & (bottom > 0)
+            hit_bottom = (top < SCREEN_HEIGHT) & (bottom > obstacle.bottom_y)
+            if self.mask_rows is not None:
+                # Only the bird's pixels in the columns the pipes cover count
+                first_rows, last_rows = self.mask_rows
+                start = max(0, obstacle.x - bird_left)
+                stop = min(BIRD_WIDTH, obstacle.x + obstacle.width - bird_left)
+                first, last = first_rows[start:stop].min(), last_rows[start:stop].max()
+                hit_top &= top + first < obstacle.top_height
+                hit_bottom &= top + last >= obstacle.bottom_y
+            hit |= hit_top | hit_bottom
+
+        # Score the obstacles passed this frame, as step_world does even for
+        # a bird that crashed during it
+        rewards = np.zeros(self.num_birds)
+        for obstacle in self.obstacles:
+            if obstacle.x + obstacle.width >= BIRD_X:
+                break
+            if not obstacle.passed:
+                obstacle.passed = True
+                rewards[alive] += 1
+        self.scores += rewards.astype(np.int64)
+
+        # Kill the birds that hit a pipe or left the screen
+        out_of_bounds = (self.y > SCREEN_HEIGHT) | (self.y < 0)
+        self.alive &= ~(hit | out_of_bounds)
+
+        info = {"scores": self.scores, "frames_survived": self.frames_survived}
+        return self.observe(), rewards, ~self.alive, info
+
+    def observe(self):
+        """
+        Return a (num_birds, len(OBSERVATION_FIELDS)) float32 array describing
+        each bird and the next obstacle ahead of it.
+        """
+        observations = np.empty((self.num_birds, len(OBSERVATION_FIELDS)), np.float32)
+        observations[:, 0] = self.y
+        observations[:, 1] = self.velocity
+        ahead = next(
+            (o for o in self.obstacles if o.x + o.width > BIRD_X - BIRD_WIDTH // 2),
+            None,
+        )
+        if ahead is None:
+            observations[:, 2] = SCREEN_WIDTH - BIRD_X
+            observations[:, 3] = 0
+            observations[:, 4] = SCREEN_HEIGHT
+        else:
+            observations[:, 2] = ahead.x - BIRD_X
+            observations[:, 3] = ahead.top_height
+            observations[:, 4] = ahead.bottom_y
+        return observations
@@ -7,6 +7,8 @@ Defines the Bird class representing the player's character.
 import pygame
 import os
 import sys
+from config.settings import SCREEN_HEIGHT
+from utils.assets import assets
 
 
 class Bird:
@@ -14,36 +16,70 @@ class Bird:
     Represents the player's bird (phoenix icon).
     """
 
+    __slots__ = (
+        "y",
+        "prev_y",
+        "velocity",
+        "gravity",
+        "flap_strength",
+        "shield",
+        "shield_timer",
+        "_image",
+        "rect",
+    )
+
+    # The bird stays at a fixed x and has a fixed size
+    x = 100
+    width = 40
+    height = 40
+
     def __init__(self, gravity: float, flap_strength: float) -> None:
-        self.x = 100
-        self.y = pygame.display.get_surface().get_height() // 2
+        self.y = SCREEN_HEIGHT // 2
+        self.prev_y = self.y
         self.velocity = 0
-        self.width = 40
-        self.height = 40
         self.gravity = gravity
         self.flap_strength = flap_strength
         self.shield = False
         self.shield_timer = 0
-        self.image = self.load_image()
-        self.rect = self.image.get_rect(center=(self.x, self.y))
+        self._image = None
+        self.rect = pygame.Rect(0, 0, self.width, self.height)
+        self.rect.center = (self.x, self.y)
+
+    @property
+    def image(self):
+        """
+        The phoenix image, loaded on first use so the bird can be simulated
+        without a display.
+        """
+        if self._image is None:
+            self._image = self.load_image()
+        return self._image
 
     def load_image(self):
         """
-        Loads the phoenix image from the assets directory.
+        Loads the phoenix image from the shared asset registry.
         """
+        image_path = os.path.join("assets", "images", "phoenix.png")
         try:
-            image_path = os.path.join("assets", "images", "phoenix.png")
-            image = pygame.image.load(image_path).convert_alpha()
-            return pygame.transform.scale(image, (self.width, self.height))
-        except pygame.error as e:
+            return assets.image("phoenix.png", (self.width, self.height))
+        except (pygame.error, FileNotFoundError) as e:
             print(f"Unable to load image '{image_path}': {e}")
             pygame.quit()
             sys.exit()
 
+    @property
+    def mask(self):
+        """
+        The collision mask of the phoenix sprite.
+        """
+        return assets.mask("phoenix.png", (self.width, self.height))
+
     def update(self):
         """
-        Updates the bird's position based on gravity.
+        Updates the bird's position based on gravity, keeping the previous
+        one for interpolated drawing.
         """
+        self.prev_y = self.y
         self.velocity += self.gravity
         self.y += self.velocity
         self.rect.centery = self.y
@@ -54,13 +90,18 @@ class Bird:
         """
         self.velocity = self.flap_strength
 
-    def draw(self, screen: pygame.Surface) -> None:
+    def draw(self, screen: pygame.Surface, alpha: float = 1.0) -> pygame.Rect:
         """
-        Draws the bird on the screen.
+        Draws the bird on the screen and returns the area it covers. alpha
+        interpolates between the previous (0) and current (1) position.
         """
-        screen.blit(self.image, self.rect)
+        position = self.rect.move(0, round((self.prev_y - self.y) * (1 - alpha)))
+        rect = screen.blit(self.image, position)
         if self.shield:
             # Draw shield indicator around bird
-            pygame.draw.circle(
-                screen, (0, 255, 255), self.rect.center, self.width // 2 + 5, 2
+            rect = rect.union(
+                pygame.draw.circle(
+                    screen, (0, 255, 255), position.center, self.width // 2 + 5, 2
+                )
             )
+        return rect
@@ -0,0 +1,204 @@
+"""
+course.py
+
+Generates seeded obstacle courses ahead of play, in chunks, and caches them.
+"""
+
+import datetime
+import itertools
+import random
+from array import array
+from collections import OrderedDict, deque
+from config.settings import (
+    SCREEN_HEIGHT,
+    OBSTACLE_SPAWN_INTERVAL,
+    POWERUP_SPAWN_INTERVAL,
+    COURSE_CHUNK_SIZE,
+    COURSE_MIN_GAP_RATIO,
+    COURSE_GAP_STEP,
+    COURSE_MAX_SHIFT,
+    COURSE_LOOKAHEAD_CHUNKS,
+    COURSE_CACHE_SIZE,
+)
+from game.obstacle import Obstacle
+from game.powerup import PowerUp
+
+# Chunks kept per cached course: the current one and those generated ahead
+COURSE_WINDOW_CHUNKS = COURSE_LOOKAHEAD_CHUNKS + 1
+
+
+class CourseChunk:
+    """
+    A run of COURSE_CHUNK_SIZE obstacles sharing one gap size. gap_tops holds
+    the top of each obstacle's gap, powerup_ys the y of the power-up placed in
+    that gap and powerup_kinds its index in PowerUp.TYPES, or -1 for none.
+    They are arrays, so every chunk takes the same memory.
+    """
+
+    __slots__ = ("index", "gap", "gap_tops", "powerup_ys", "powerup_kinds")
+
+    def __init__(self, index: int, gap: int) -> None:
+        self.index = index
+        self.gap = gap
+        self.gap_tops = array("h")
+        self.powerup_ys = array("h")
+        self.powerup_kinds = array("b")
+
+    def powerup(self, slot: int):
+        """
+        Return the (y, kind) of the power-up in gap slot, or None.
+        """
+        kind = self.powerup_kinds[slot]
+        if kind < 0:
+            return None
+        return self.powerup_ys[slot], PowerUp.TYPES[kind]
+
+
+def generate_course(seed, base_gap: int):
+    """
+    Yield the chunks of the course for seed, without end. The gap starts at
+    base_gap and narrows by COURSE_GAP_STEP each chunk down to
+    COURSE_MIN_GAP_RATIO of base_gap, so courses with different starting
+    gaps stay apart however long the game runs. No gap moves more than
+    COURSE_MAX_SHIFT from the one before it. Power-ups sit inside the gaps,
+    as often on average as one every POWERUP_SPAWN_INTERVAL frames.
+    """
+    rng = random.Random(seed)
+    min_gap = round(base_gap * COURSE_MIN_GAP_RATIO)
+    powerup_chance = OBSTACLE_SPAWN_INTERVAL / POWERUP_SPAWN_INTERVAL
+    margin = PowerUp.height // 2
+    top = None
+    for index in itertools.count():
+        gap = max(min_gap, base_gap - index * COURSE_GAP_STEP)
+        chunk = CourseChunk(index, gap)
+        for _ in range(COURSE_CHUNK_SIZE):
+            low, high = 50, SCREEN_HEIGHT - gap - 50
+            if top is not None:
+                low = max(low, top - COURSE_MAX_SHIFT)
+                high = min(high, top + COURSE_MAX_SHIFT)
+            top = rng.randint(low, high)
+            chunk.gap_tops.append(top)
+            if rng.random() < powerup_chance:
+                chunk.powerup_ys.append(rng.randint(top + margin, top + gap - margin))
+                chunk.powerup_kinds.append(
+                    PowerUp.TYPES.index(rng.choice(PowerUp.TYPES))
+                )
+            else:
+                chunk.powerup_ys.append(0)
+                chunk.powerup_kinds.append(-1)
+        yield chunk
+
+
+class CourseCache:
+    """
+    A least-recently-used cache of generated courses keyed by (seed, gap).
+    Each course keeps its opening COURSE_WINDOW_CHUNKS chunks, so replays and
+    repeated seeds start without generating anything, and beyond those only
+    the current chunk and the COURSE_LOOKAHEAD_CHUNKS generated ahead of it,
+    so a game that never ends holds a fixed amount of memory. A later chunk
+    that has fallen out of that window is generated again from the seed.
+    """
+
+    def __init__(self, max_size: int = COURSE_CACHE_SIZE) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._courses = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._courses)
+
+    def chunk(self, seed, gap: int, index: int) -> CourseChunk:
+        """
+        Return chunk index of the course for (seed, gap), generating it and
+        any chunks before it on a miss.
+        """
+        key = (seed, gap)
+        course = self._courses.get(key)
+        if course is None:
+            # Generator, index of its next chunk, opening chunks, recent chunks
+            course = self._courses[key] = [
+                None,
+                0,
+                [],
+                deque(maxlen=COURSE_WINDOW_CHUNKS),
+            ]
+            if len(self._courses) > self.max_size:
+                self._courses.popitem(last=False)
+        else:
+            self._courses.move_to_end(key)
+
+        opening, chunks = course[2], course[3]
+        if index < len(opening):
+            self.hits += 1
+            return opening[index]
+        if chunks and chunks[0].index <= index <= chunks[-1].index:
+            self.hits += 1
+            return chunks[index - chunks[0].index]
+        self.misses += 1
+        if course[0] is None or index < course[1]:
+            # Start the generator over for a chunk already dropped
+            course[0] = generate_course(seed, gap)
+            course[1] = 0
+            chunks.clear()
+        while course[1] <= index:
+            chunk = next(course[0])
+            course[1] += 1
+            chunks.append(chunk)
+            if chunk.index == len(opening) < COURSE_WINDOW_CHUNKS:
+                opening.append(chunk)
+        return chunks[-1]
+
+    def clear(self) -> None:
+        """
+        Drop every cached course and reset the counters.
+        """
+        self._courses.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# Shared cache, so replays and repeated seeds reuse generated courses
+course_cache = CourseCache()
+
+
+class Course:
+    """
+    Hands out the obstacles of one seeded course in order, keeping
+    COURSE_LOOKAHEAD_CHUNKS chunks generated ahead of the current one.
+    """
+
+    def __init__(self, seed, gap: int = None) -> None:
+        self.seed = seed
+        self.gap = Obstacle.GAP if gap is None else gap
+        self.obstacle_count = 0
+        self._chunk = None
+
+    def next_obstacle(self):
+        """
+        Return (gap_top, gap, powerup) for the next obstacle, where powerup
+        is None or the (y, kind) of a power-up in the gap.
+        """
+        index, slot = divmod(self.obstacle_count, COURSE_CHUNK_SIZE)
+        if slot == 0:
+            self._chunk = course_cache.chunk(self.seed, self.gap, index)
+            course_cache.chunk(self.seed, self.gap, index + COURSE_LOOKAHEAD_CHUNKS)
+        self.obstacle_count += 1
+        chunk = self._chunk
+        return chunk.gap_tops[slot], chunk.gap, chunk.powerup(slot)
+
+
+def next_course(rng, gap: int = None) -> Course:
+    """
+    Return the course for the next game of a session, seeded from the
+    session's random stream, starting at gap (default Obstacle.GAP).
+    """
+    return Course(rng.getrandbits(32), gap)
+
+
+def daily_seed(date=None) -> int:
+    """
+    Return the session seed shared by everyone on date (default today).
+    """
+    date = date or datetime.date.today()
+    return int(date.strftime("%Y%m%d"))
@@ -5,14 +5,19 @@ Defines the Obstacle class representing obstacles in the game.
 """
 
 import pygame
-import random
 from config.settings import (
     SCREEN_HEIGHT,
     OBSTACLE_GAP,
     OBSTACLE_WIDTH,
     SCI_FI_BLUE,
     OBSTACLE_VELOCITY,
+    PIXEL_PERFECT_COLLISION,
 )
+from utils.pipe_cache import pipe_cache
+
+# A pipe's collision mask. Pipes are solid, so one filled mask placed to end
+# at a gap edge stands for the top or bottom pipe of any obstacle.
+_PIPE_MASK = pygame.mask.Mask((OBSTACLE_WIDTH, SCREEN_HEIGHT), fill=True)
 
 
 class Obstacle:
@@ -20,43 +25,88 @@ class Obstacle:
     Represents an obstacle (pair of top and bottom pipes).
     """
 
-    def __init__(self, x):
+    __slots__ = (
+        "x",
+        "top_height",
+        "bottom_y",
+        "top_rect",
+        "bottom_rect",
+        "passed",
+        "velocity",
+    )
+
+    GAP = OBSTACLE_GAP
+    VELOCITY = OBSTACLE_VELOCITY
+    PIXEL_PERFECT = PIXEL_PERFECT_COLLISION
+    width = OBSTACLE_WIDTH
+    color = SCI_FI_BLUE
+
+    def __init__(self, x, top_height=None, gap=None, velocity=None):
+        self.velocity = self.VELOCITY if velocity is None else velocity
+        self.top_rect = pygame.Rect(0, 0, self.width, 0)
+        self.bottom_rect = pygame.Rect(0, 0, self.width, 0)
+        if top_height is None:
+            top_height = (SCREEN_HEIGHT - (gap or self.GAP)) // 2
+        self.reset(x, top_height, gap)
+
+    def reset(self, x, top_height, gap=None):
+        """
+        Places the obstacle at x with its gap from top_height down gap pixels
+        (default GAP), so a pooled obstacle can be reused without allocating.
+        """
         self.x = x
-        self.width = OBSTACLE_WIDTH
-        self.gap = OBSTACLE_GAP
-        self.top_height = random.randint(50, SCREEN_HEIGHT - self.gap - 50)
-        self.bottom_y = self.top_height + self.gap
-        self.color = SCI_FI_BLUE
+        self.top_height = top_height
+        self.bottom_y = top_height + (gap or self.GAP)
+        self.top_rect.update(self.x, 0, self.width, self.top_height)
+        self.bottom_rect.update(
+            self.x, self.bottom_y, self.width, SCREEN_HEIGHT - self.bottom_y
+        )
         self.passed = (
             False  # Used to check if the bird has passed the obstacle for scoring
         )
 
     def update(self):
         """
-        Updates the obstacle's position.
+        Updates the obstacle's position, moving its cached rects in place.
         """
-        self.x += OBSTACLE_VELOCITY
+        self.x += self.velocity
+        self.top_rect.x = self.x
+        self.bottom_rect.x = self.x
 
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0, color=None):
         """
-        Draws the obstacle on the screen.
+        Draws the obstacle on the screen and returns the areas it covers.
+        alpha interpolates between the previous (0) and current (1) position,
+        and color picks the theme's pipe texture (default the class color).
         """
+        x = self.x + self.velocity * (alpha - 1)
+        color = color or self.color
         # Draw the top obstacle
-        pygame.draw.rect(screen, self.color, (self.x, 0, self.width, self.top_height))
+        top = screen.blit(pipe_cache.top(color, self.top_height), (x, 0))
         # Draw the bottom obstacle
-        pygame.draw.rect(
-            screen,
-            self.color,
-            (self.x, self.bottom_y, self.width, SCREEN_HEIGHT - self.bottom_y),
+        bottom = screen.blit(
+            pipe_cache.bottom(color, SCREEN_HEIGHT - self.bottom_y), (x, self.bottom_y)
         )
+        return [top, bottom]
 
     def collide(self, bird):
         """
-        Checks for collision with the bird.
+        Checks for collision with the bird: the rects first, then the bird's
+        pixels against either pipe.
         """
         bird_rect = bird.rect
-        top_rect = pygame.Rect(self.x, 0, self.width, self.top_height)
-        bottom_rect = pygame.Rect(
-            self.x, self.bottom_y, self.width, SCREEN_HEIGHT - self.bottom_y
+        if not (
+            bird_rect.colliderect(self.top_rect)
+            or bird_rect.colliderect(self.bottom_rect)
+        ):
+            return False
+        if not self.PIXEL_PERFECT:
+            return True
+        mask = bird.mask
+        dx = self.x - bird_rect.x
+        top_offset = (dx, self.top_height - SCREEN_HEIGHT - bird_rect.y)
+        bottom_offset = (dx, self.bottom_y - bird_rect.y)
+        return (
+            mask.overlap(_PIPE_MASK, top_offset) is not None
+            or mask.overlap(_PIPE_MASK, bottom_offset) is not None
         )
-        return bird_rect.colliderect(top_rect) or bird_rect.colliderect(bottom_rect)
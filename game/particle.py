@@ -1,11 +1,12 @@
 """
 particle.py
 
-Defines the Particle class for visual effects.
+Defines the Particle class and the pooled ParticleSystem for visual effects.
 """
 
 import pygame
 import random
+import numpy as np
 
 
 class Particle:
@@ -13,10 +14,13 @@ class Particle:
     Represents a particle for visual effects.
     """
 
+    __slots__ = ("x", "y", "radius", "life", "velocity")
+
+    color = (255, 255, 255)
+
     def __init__(self, position):
         self.x, self.y = position
         self.radius = random.randint(2, 4)
-        self.color = (255, 255, 255)
         self.life = 20  # Frames to live
         self.velocity = [random.uniform(-1, 1), random.uniform(-2, 0)]
 
@@ -36,3 +40,151 @@ class Particle:
             pygame.draw.circle(
                 screen, self.color, (int(self.x), int(self.y)), self.radius
             )
+
+
+class ParticleSystem:
+    """
+    A fixed-capacity pool of particles stored as NumPy arrays.
+
+    New particles are written into a ring buffer, overwriting the oldest ones
+    once the pool is full, so emitting never allocates. Every particle lives
+    LIFE frames, so the live ones are always the last ones emitted, a run of
+    the buffer ending at its head; update and draw touch only that run.
+    Single particles, the game's usual rate, take their random values from a
+    block drawn RANDOM_BLOCK at a time, since a NumPy call per particle costs
+    more than the particle.
+    """
+
+    MIN_RADIUS = 2
+    MAX_RADIUS = 4
+    LIFE = 20  # Frames to live
+    COLOR = (255, 255, 255)
+    RANDOM_BLOCK = 256  # Single emits drawn at once
+
+    def __init__(self, capacity: int = 4096, seed=None) -> None:
+        self.capacity = capacity
+        self.seed = seed
+        self._rng = None
+        self.position = np.zeros((capacity, 2))
+        self.velocity = np.zeros((capacity, 2))
+        self.life = np.zeros(capacity, dtype=np.int32)
+        self.radius = np.zeros(capacity, dtype=np.int32)
+        self._head = 0
+        self._live = 0  # Length of the run of live particles ending at _head
+        self._sprites = None
+        self._draws = ([], [], [])
+
+    def __len__(self) -> int:
+        return self._live
+
+    @property
+    def rng(self):
+        """
+        The random generator for new particles, created on first use because
+        importing numpy.random slows startup.
+        """
+        if self._rng is None:
+            self._rng = np.random.default_rng(self.seed)
+        return self._rng
+
+    def _spans(self):
+        """
+        Return the slices of the buffer holding live particles, oldest
+        first: one, or two when the run wraps past the end.
+        """
+        start = self._head - self._live
+        if start >= 0:
+            return (slice(start, self._head),)
+        return (slice(start + self.capacity, self.capacity), slice(0, self._head))
+
+    def emit(self, position, count: int = 1) -> None:
+        """
+        Spawn count particles at the given position.
+        """
+        if count == 1:
+            self._emit_one(position)
+            return
+        count = min(count, self.capacity)
+        index = (self._head + np.arange(count)) % self.capacity
+        self._head = (self._head + count) % self.capacity
+        self._live = min(self._live + count, self.capacity)
+        self.position[index] = position
+        self.velocity[index, 0] = self.rng.uniform(-1, 1, count)
+        self.velocity[index, 1] = self.rng.uniform(-2, 0, count)
+        self.life[index] = self.LIFE
+        self.radius[index] = self.rng.integers(
+            self.MIN_RADIUS, self.MAX_RADIUS + 1, count
+        )
+
+    def _emit_one(self, position) -> None:
+        """
+        Spawn one particle with scalar stores, refilling the random block
+        when it runs out.
+        """
+        vx, vy, radius = self._draws
+        if not vx:
+            rng = self.rng
+            block = self.RANDOM_BLOCK
+            vx = rng.uniform(-1, 1, block).tolist()
+            vy = rng.uniform(-2, 0, block).tolist()
+            radius = rng.integers(self.MIN_RADIUS, self.MAX_RADIUS + 1, block).tolist()
+            self._draws = vx, vy, radius
+        index = self._head
+        self._head = (index + 1) % self.capacity
+        self._live = min(self._live + 1, self.capacity)
+        self.position[index] = position
+        self.velocity[index] = vx.pop(), vy.pop()
+        self.radius[index] = radius.pop()
+        self.life[index] = self.LIFE
+
+    def update(self) -> None:
+        """
+        Move the live particles and age them by one frame.
+        """
+        for span in self._spans():
+            self.position[span] += self.velocity[span]
+            self.life[span] -= 1
+        # The oldest particles die first
+        life = self.life
+        while self._live and life[self._head - self._live] <= 0:
+            self._live -= 1
+
+    def clear(self) -> None:
+        """
+        Kill every particle.
+        """
+        self.life[:] = 0
+        self._live = 0
+
+    def load_sprites(self):
+        """
+        Pre-render one circle sprite per particle radius.
+        """
+        sprites = {}
+        for radius in range(self.MIN_RADIUS, self.MAX_RADIUS + 1):
+            sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, self.COLOR, (radius, radius), radius)
+            sprites[radius] = sprite
+        return sprites
+
+    def draw(self, screen, alpha=1.0):
+        """
+        Draw every live particle with a single batched blit and return the
+        areas they cover. alpha interpolates between the previous (0) and
+        current (1) positions.
+        """
+        if not self._live:
+            return []
+        if self._sprites is None:
+            self._sprites = self.load_sprites()
+        sprites = self._sprites
+        blits = []
+        for span in self._spans():
+            radius = self.radius[span]
+            corners = self.position[span] + self.velocity[span] * (alpha - 1)
+            corners -= radius[:, np.newaxis]
+            blits += zip(
+                [sprites[r] for r in radius.tolist()],
+                corners.astype(np.int32).tolist(),
+            )
+        return screen.blits(blits)
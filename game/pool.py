@@ -0,0 +1,62 @@
+"""
+pool.py
+
+Defines the EntityPool class for recycling obstacles and power-ups.
+"""
+
+from collections import deque
+
+
+class EntityPool:
+    """
+    A set of reusable entities, so spawning and despawning do not allocate.
+
+    Live entities are kept in spawn order. Obstacles and power-ups all spawn
+    at the right edge and scroll at the same speed, so spawn order is also x
+    order and the entity leaving the screen is always the first one, which
+    despawn_first() recycles in O(1). Spawned entities are re-initialized in
+    place with their reset(...) method.
+    """
+
+    def __init__(self, factory, capacity: int = 8) -> None:
+        self._factory = factory
+        self._free = [factory() for _ in range(capacity)]
+        self._active = deque()
+
+    def __len__(self) -> int:
+        return len(self._active)
+
+    def __iter__(self):
+        return iter(self._active)
+
+    def __getitem__(self, index):
+        return self._active[index]
+
+    def spawn(self):
+        """
+        Make a free entity live and return it for the caller to reset(). The
+        pool only allocates a new entity if every one is already live.
+        """
+        entity = self._free.pop() if self._free else self._factory()
+        self._active.append(entity)
+        return entity
+
+    def despawn_first(self) -> None:
+        """
+        Recycle the oldest live entity.
+        """
+        self._free.append(self._active.popleft())
+
+    def despawn(self, entity) -> None:
+        """
+        Recycle a live entity from anywhere in the pool.
+        """
+        self._active.remove(entity)
+        self._free.append(entity)
+
+    def clear(self) -> None:
+        """
+        Recycle every live entity.
+        """
+        self._free.extend(self._active)
+        self._active.clear()
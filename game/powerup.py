@@ -5,9 +5,14 @@ Defines the PowerUp class for power-up items.
 """
 
 import pygame
-import random
 import os
-from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT, OBSTACLE_VELOCITY
+from config.settings import (
+    SCREEN_WIDTH,
+    SCREEN_HEIGHT,
+    OBSTACLE_VELOCITY,
+    PIXEL_PERFECT_COLLISION,
+)
+from utils.assets import assets
 
 
 class PowerUp:
@@ -15,25 +20,49 @@ class PowerUp:
     Represents a power-up in the game.
     """
 
-    def __init__(self, x):
+    __slots__ = ("x", "y", "type", "_image", "rect", "speed")
+
+    TYPES = ["shield", "score_boost"]
+    SPEED = OBSTACLE_VELOCITY
+    PIXEL_PERFECT = PIXEL_PERFECT_COLLISION
+    width = 30
+    height = 30
+
+    def __init__(self, x, y=SCREEN_HEIGHT // 2, kind="shield", speed=None):
+        self.speed = self.SPEED if speed is None else speed
+        self.rect = pygame.Rect(0, 0, self.width, self.height)
+        self.reset(x, y, kind)
+
+    def reset(self, x, y, kind):
+        """
+        Places a power-up of the given kind centred on (x, y), so a pooled
+        power-up can be reused without allocating.
+        """
         self.x = x
-        self.y = random.randint(100, SCREEN_HEIGHT - 100)
-        self.type = random.choice(["shield", "score_boost"])
-        self.width = 30
-        self.height = 30
-        self.image = self.load_image()
-        self.rect = self.image.get_rect(center=(self.x, self.y))
-        self.speed = OBSTACLE_VELOCITY
+        self.y = y
+        self.type = kind
+        self._image = None
+        self.rect.center = (self.x, self.y)
+
+    @property
+    def image(self):
+        """
+        The power-up image, loaded on first use so power-ups can be simulated
+        without a display.
+        """
+        if self._image is None:
+            self._image = self.load_image()
+        return self._image
 
     def load_image(self):
         """
-        Load the power-up image based on its type.
+        Load the power-up image based on its type from the shared asset
+        registry.
         """
+        image_path = os.path.join("assets", "images", f"{self.type}.png")
         try:
-            image_path = os.path.join("assets", "images", f"{self.type}.png")
-            image = pygame.image.load(image_path).convert_alpha()
-            return pygame.transform.scale(image, (self.width, self.height))
-        except pygame.error as e:
+            return assets.image(f"{self.type}.png", (self.width, self.height))
+        except (pygame.error, FileNotFoundError) as e:
             print(f"Unable to load image '{image_path}': {e}")
             pygame.quit()
 
@@ -44,14 +73,22 @@ class PowerUp:
         self.x += self.speed
         self.rect.centerx = self.x
 
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
         """
-        Draw the power-up on the screen.
+        Draw the power-up on the screen and return the area it covers. alpha
+        interpolates between the previous (0) and current (1) position.
         """
-        screen.blit(self.image, self.rect)
+        return screen.blit(self.image, self.rect.move(self.speed * (alpha - 1), 0))
 
     def collide(self, bird):
         """
-        Check for collision with the bird.
+        Check for collision with the bird, comparing their sprites' pixels
+        once their rects overlap.
         """
-        return self.rect.colliderect(bird.rect)
+        if not self.rect.colliderect(bird.rect):
+            return False
+        if not self.PIXEL_PERFECT:
+            return True
+        mask = assets.mask(f"{self.type}.png", (self.width, self.height))
+        offset = (self.rect.x - bird.rect.x, self.rect.y - bird.rect.y)
+        return bird.mask.overlap(mask, offset) is not None
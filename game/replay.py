@@ -0,0 +1,140 @@
+"""
+replay.py
+
+Records the game's key inputs to a compact binary file and plays them back,
+either through main() or headless at full speed.
+
+A recording is a header (magic, version, seed) followed by one record per
+game key press: the simulation step it preceded and the pygame key code. A
+final record with key code 0 marks the step the recording ended on.
+"""
+
+import random
+import struct
+import sys
+import time
+import pygame
+from config.settings import SCREEN_WIDTH, THEMES, DIFFICULTY_LEVELS, PROFILES
+from game.bird import Bird
+from game.course import next_course
+from game.obstacle import Obstacle
+from game.pool import EntityPool
+from game.powerup import PowerUp
+from game.simulation import step_world
+from game.state import GameState
+from utils.audio import NullAudio
+from utils.helpers import handle_key
+
+MAGIC = b"FZRP"
+VERSION = 2  # Version 2 games are played on generated courses
+HEADER = struct.Struct("<4sHQ")  # Magic, version, seed
+RECORD = struct.Struct("<IH")  # Simulation step, key code
+END_OF_RECORDING = 0
+
+# Keys that change the game; debugging and quit keys are not recorded
+RECORDED_KEYS = {
+    pygame.K_SPACE,
+    pygame.K_g,
+    pygame.K_r,
+    *(ord(theme.key) for theme in PROFILES.themes.values()),
+    *(ord(difficulty.key) for difficulty in DIFFICULTY_LEVELS.values()),
+}
+
+
+class InputRecorder:
+    """
+    Writes the game keys pressed before each simulation step to a file.
+    The game loop increments step after every simulation step.
+    """
+
+    def __init__(self, path: str, seed: int) -> None:
+        self.step = 0
+        self._file = open(path, "wb")
+        self._file.write(HEADER.pack(MAGIC, VERSION, seed))
+
+    def record(self, key: int) -> None:
+        """
+        Record a key press made before the current step.
+        """
+        if key in RECORDED_KEYS and not self._file.closed:
+            self._file.write(RECORD.pack(self.step, key))
+
+    def close(self) -> None:
+        """
+        Mark the end of the recording and close the file.
+        """
+        if not self._file.closed:
+            self._file.write(RECORD.pack(self.step, END_OF_RECORDING))
+            self._file.close()
+
+
+class Recording:
+    """
+    A loaded recording: the seed, the key presses by step, and the number of
+    steps it covers.
+    """
+
+    def __init__(self, seed: int, inputs: dict, steps: int) -> None:
+        self.seed = seed
+        self.inputs = inputs
+        self.steps = steps
+
+    @classmethod
+    def load(cls, path: str):
+        """
+        Read a recording from a file.
+        """
+        with open(path, "rb") as file:
+            data = file.read()
+        magic, version, seed = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"'{path}' is not a version {VERSION} recording")
+        inputs = {}
+        steps = 0
+        for step, key in RECORD.iter_unpack(data[HEADER.size :]):
+            if key == END_OF_RECORDING:
+                steps = step
+            else:
+                inputs.setdefault(step, []).append(key)
+                steps = max(steps, step)
+        return cls(seed, inputs, steps)
+
+
+def replay_headless(recording):
+    """
+    Replays a recording without a display, as fast as possible, and returns
+    the final game state.
+    """
+    rng = random.Random(recording.seed)
+    course = next_course(rng)
+    backgrounds = dict.fromkeys(THEMES)
+    audio = NullAudio()
+    game_state = GameState()
+    bird = Bird(game_state.gravity, game_state.flap_strength)
+    obstacles = EntityPool(lambda: Obstacle(SCREEN_WIDTH))
+    powerups = EntityPool(lambda: PowerUp(SCREEN_WIDTH))
+
+    for step in range(recording.steps):
+        for key in recording.inputs.get(step, ()):
+            handle_key(key, bird, game_state, backgrounds, audio)
+        if game_state.reset:
+            bird = Bird(game_state.gravity, game_state.flap_strength)
+            obstacles.clear()
+            powerups.clear()
+            course = next_course(rng)
+            game_state.new_game()
+        game_state.frame_count += 1
+        step_world(bird, obstacles, None, game_state, None, powerups, course)
+    return game_state
+
+
+if __name__ == "__main__":
+    recording = Recording.load(sys.argv[1])
+    start = time.perf_counter()
+    game_state = replay_headless(recording)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{recording.steps} steps in {elapsed:.3f} s "
+        f"({recording.steps / max(elapsed, 1e-9):.0f} steps/s), "
+        f"state {game_state.state}, score {game_state.score}"
+    )
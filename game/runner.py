@@ -0,0 +1,183 @@
+"""
+runner.py
+
+Plays large batches of seeded headless games across a process pool and
+summarizes the results. Run from the project root, for example:
+
+    python -m game.runner --games 1000 --levels easy hard --gaps 160 200
+"""
+
+import argparse
+import itertools
+import json
+import os
+import statistics
+import sys
+import time
+from multiprocessing import Pool
+from config.settings import DIFFICULTY_LEVELS, OBSTACLE_GAP, OBSTACLE_VELOCITY
+from game.autopilot import autopilot_policy
+from game.simulation import Simulation
+
+# The parameters that identify one configuration of a sweep
+CONFIG_KEYS = ("policy", "level", "gap", "velocity", "gravity")
+
+
+def gap_policy(sim) -> bool:
+    """
+    A simple autopilot: flap when the bird has sunk below the middle of the
+    next gap and is not already rising fast.
+    """
+    bird = sim.bird
+    target = 350
+    for obstacle in sim.obstacles:
+        if obstacle.x + obstacle.width > bird.x - bird.width // 2:
+            target = (obstacle.top_height + obstacle.bottom_y) / 2 + 25
+            break
+    return bird.y > target and bird.velocity > -2
+
+
+# The policies a sweep can play with, by name
+POLICIES = {"gap": gap_policy, "predictive": autopilot_policy}
+
+
+def play_game(task: dict) -> dict:
+    """
+    Play one headless game described by task and return its result.
+    """
+    sim = Simulation(
+        task["level"],
+        seed=task["seed"],
+        gravity=task["gravity"],
+        gap=task["gap"],
+        velocity=task["velocity"],
+    )
+    sim.run(POLICIES[task["policy"]], task["max_frames"])
+    return {
+        **task,
+        "score": sim.game_state.score,
+        "frames": sim.game_state.frame_count,
+        "cause_of_death": sim.game_state.cause_of_death,
+        "powerups": sim.powerups_collected,
+    }
+
+
+def make_tasks(
+    games, levels, gaps, velocities, gravities, max_frames, seed=0, policies=("gap",)
+):
+    """
+    Build one task per game for every combination of the sweep parameters.
+    A gravity of None uses the level's own gravity.
+    """
+    tasks = []
+    for policy, level, gap, velocity, gravity in itertools.product(
+        policies, levels, gaps, velocities, gravities
+    ):
+        if gravity is None:
+            gravity = DIFFICULTY_LEVELS[level].gravity
+        for game in range(games):
+            tasks.append(
+                {
+                    "seed": seed + game,
+                    "policy": policy,
+                    "level": level,
+                    "gap": gap,
+                    "velocity": velocity,
+                    "gravity": gravity,
+                    "max_frames": max_frames,
+                }
+            )
+    return tasks
+
+
+def run_games(tasks, workers=None):
+    """
+    Play the tasks across a pool of worker processes, yielding each result as
+    soon as it is ready (not in task order).
+    """
+    workers = workers or os.cpu_count()
+    # Large chunks keep inter-process overhead low while still giving every
+    # worker several chunks to balance uneven game lengths
+    chunksize = max(1, len(tasks) // (workers * 8))
+    with Pool(workers) as pool:
+        yield from pool.imap_unordered(play_game, tasks, chunksize)
+
+
+def summarize(results) -> list:
+    """
+    Aggregate results into one summary per sweep configuration.
+    """
+    groups = {}
+    for result in results:
+        key = tuple(result[k] for k in CONFIG_KEYS)
+        groups.setdefault(key, []).append(result)
+
+    summaries = []
+    for key, group in sorted(groups.items()):
+        scores = [r["score"] for r in group]
+        causes = {}
+        for result in group:
+            cause = result["cause_of_death"] or "survived"
+            causes[cause] = causes.get(cause, 0) + 1
+        summaries.append(
+            {
+                **dict(zip(CONFIG_KEYS, key)),
+                "games": len(group),
+                "mean_score": statistics.fmean(scores),
+                "median_score": statistics.median(scores),
+                "max_score": max(scores),
+                "mean_frames": statistics.fmean(r["frames"] for r in group),
+                "mean_powerups": statistics.fmean(r["powerups"] for r in group),
+                "causes_of_death": causes,
+            }
+        )
+    return summaries
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Play seeded headless games in parallel and summarize them."
+    )
+    parser.add_argument("--games", type=int, default=100, help="games per config")
+    parser.add_argument(
+        "--policies", nargs="+", default=["gap"], choices=list(POLICIES)
+    )
+    parser.add_argument("--levels", nargs="+", default=list(DIFFICULTY_LEVELS))
+    parser.add_argument("--gaps", nargs="+", type=int, default=[OBSTACLE_GAP])
+    parser.add_argument(
+        "--velocities", nargs="+", type=int, default=[OBSTACLE_VELOCITY]
+    )
+    parser.add_argument("--gravities", nargs="+", type=float, default=[None])
+    parser.add_argument("--max-frames", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--output", help="stream per-game results to this JSONL file")
+    args = parser.parse_args()
+
+    tasks = make_tasks(
+        args.games,
+        args.levels,
+        args.gaps,
+        args.velocities,
+        args.gravities,
+        args.max_frames,
+        args.seed,
+        args.policies,
+    )
+    output = open(args.output, "w") if args.output else None
+    results = []
+    start = time.perf_counter()
+    for result in run_games(tasks, args.workers):
+        results.append(result)
+        if output:
+            output.write(json.dumps(result) + "\n")
+    elapsed = time.perf_counter() - start
+    if output:
+        output.close()
+
+    json.dump(summarize(results), sys.stdout, indent=2)
+    print(f"\n{len(results)} games in {elapsed:.2f} s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
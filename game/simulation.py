@@ -0,0 +1,225 @@
+"""
+simulation.py
+
+Runs the game rules (physics, spawning, collisions and scoring) without
+a display, audio or image loading; collision masks come from the bitmaps
+shipped in assets/masks.
+"""
+
+import random
+from config.settings import (
+    SCREEN_WIDTH,
+    SCREEN_HEIGHT,
+    OBSTACLE_SPAWN_INTERVAL,
+    SHIELD_DURATION,
+    DIFFICULTY_LEVELS,
+)
+from game.bird import Bird
+from game.course import next_course
+from game.obstacle import Obstacle
+from game.pool import EntityPool
+from game.powerup import PowerUp
+from game.state import GameState, STATE_PLAYING, STATE_GAME_OVER
+from utils.profiler import profiler
+
+# Events reported by step_world
+EVENT_SCORE = "score"
+EVENT_POWERUP = "powerup"
+EVENT_GAME_OVER = "game_over"
+
+
+def step_world(bird, obstacles, stars, game_state, particles, powerups, course):
+    """
+    Advances the world by one frame and returns the list of events that
+    happened during it. Callers decide how to present them (sounds, logs).
+    Pass stars=None or particles=None to skip the purely visual effects.
+    Obstacles and the power-ups in their gaps come from course, a seeded
+    game.course.Course, so the game is reproducible.
+
+    Obstacles and power-ups are EntityPools. They all spawn at the right edge
+    and scroll at the same speed, so both stay sorted by x. Collision and
+    scoring sweep them from the left and stop at the first entity past the
+    bird's column, and off-screen entities are recycled from the front.
+    """
+    events = []
+
+    # Update stars
+    if stars is not None:
+        with profiler.section("update.stars"):
+            stars.update()
+
+    if game_state.state != STATE_PLAYING:
+        return events
+
+    # Update bird
+    with profiler.section("update.bird"):
+        bird.update()
+
+    if particles is not None:
+        # Generate and update particles
+        with profiler.section("update.particles"):
+            particles.emit((bird.x, bird.y))
+            particles.update()
+
+    with profiler.section("update.obstacles"):
+        # Spawn the next obstacle of the course, with its power-up centred
+        # in the gap
+        if game_state.frame_count % OBSTACLE_SPAWN_INTERVAL == 0:
+            gap_top, gap, powerup = course.next_obstacle()
+            obstacles.spawn().reset(SCREEN_WIDTH, gap_top, gap)
+            if powerup is not None:
+                y, kind = powerup
+                powerups.spawn().reset(SCREEN_WIDTH + Obstacle.width // 2, y, kind)
+
+        # Update obstacles
+        for obstacle in obstacles:
+            obstacle.update()
+
+        # Recycle obstacles that have gone off screen
+        while obstacles and obstacles[0].x + obstacles[0].width <= 0:
+            obstacles.despawn_first()
+
+    with profiler.section("update.powerups"):
+        # Update power-ups
+        for powerup in powerups:
+            powerup.update()
+
+        # Collect the power-ups in the bird's column
+        collected = []
+        for powerup in powerups:
+            if powerup.rect.left >= bird.rect.right:
+                break
+            if powerup.rect.right > bird.rect.left and powerup.collide(bird):
+                collected.append(powerup)
+        for powerup in collected:
+            # Handle power-up effect
+            if powerup.type == "shield":
+                bird.shield = True
+                bird.shield_timer = SHIELD_DURATION
+            elif powerup.type == "score_boost":
+                game_state.score += 5
+            powerups.despawn(powerup)
+            events.append(EVENT_POWERUP)
+
+        # Recycle off-screen power-ups
+        while powerups and powerups[0].x + powerups[0].width <= 0:
+            powerups.despawn_first()
+
+    with profiler.section("update.collisions"):
+        # Check for collisions against the obstacles in the bird's column
+        # (a shielded bird passes through obstacles)
+        if not bird.shield:
+            for obstacle in obstacles:
+                if obstacle.x >= bird.rect.right:
+                    break
+                if obstacle.x + obstacle.width <= bird.rect.left:
+                    continue
+                if obstacle.collide(bird):
+                    game_state.state = STATE_GAME_OVER
+                    game_state.cause_of_death = "obstacle"
+                    break
+
+        # Check if bird hits the ground or goes off the screen
+        if game_state.state == STATE_PLAYING and (bird.y > SCREEN_HEIGHT or bird.y < 0):
+            game_state.state = STATE_GAME_OVER
+            game_state.cause_of_death = "out_of_bounds"
+
+    with profiler.section("update.scoring"):
+        # Update score; only the obstacles left of the bird can be passed
+        for obstacle in obstacles:
+            if obstacle.x + obstacle.width >= bird.x:
+                break
+            if not obstacle.passed:
+                obstacle.passed = True
+                game_state.score += 1
+                events.append(EVENT_SCORE)
+
+    if game_state.state == STATE_GAME_OVER:
+        events.append(EVENT_GAME_OVER)
+
+    # Update shield timer
+    if bird.shield:
+        bird.shield_timer -= 1
+        if bird.shield_timer <= 0:
+            bird.shield = False
+
+    return events
+
+
+class Simulation:
+    """
+    A single headless game, stepped one frame at a time. gravity,
+    flap_strength, gap and velocity (the obstacles' speed) default to the
+    level's and the game's settings.
+    """
+
+    def __init__(
+        self,
+        level: str = "medium",
+        seed=None,
+        gravity=None,
+        flap_strength=None,
+        gap=None,
+        velocity=None,
+    ) -> None:
+        self.level = level
+        self.rng = random.Random(seed)
+        self.gap = gap
+        self.obstacles = EntityPool(lambda: Obstacle(SCREEN_WIDTH, velocity=velocity))
+        self.powerups = EntityPool(lambda: PowerUp(SCREEN_WIDTH, speed=velocity))
+        difficulty = DIFFICULTY_LEVELS[level]
+        self.gravity = difficulty.gravity if gravity is None else gravity
+        self.flap_strength = (
+            difficulty.flap_strength if flap_strength is None else flap_strength
+        )
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Starts a new game at the configured difficulty level.
+        """
+        self.bird = Bird(self.gravity, self.flap_strength)
+        self.course = next_course(self.rng, self.gap)
+        self.obstacles.clear()
+        self.stars = None  # Stars and particles are visual only
+        self.particles = None
+        self.powerups.clear()
+        self.game_state = GameState(
+            STATE_PLAYING, self.level, self.gravity, self.flap_strength
+        )
+        self.powerups_collected = 0
+
+    @property
+    def done(self) -> bool:
+        """
+        Whether the game has ended.
+        """
+        return self.game_state.state == STATE_GAME_OVER
+
+    def step(self, flap: bool = False) -> list:
+        """
+        Advances the game by one frame, flapping first if requested.
+        """
+        self.game_state.frame_count += 1
+        if flap:
+            self.bird.flap()
+        events = step_world(
+            self.bird,
+            self.obstacles,
+            self.stars,
+            self.game_state,
+            self.particles,
+            self.powerups,
+            self.course,
+        )
+        self.powerups_collected += events.count(EVENT_POWERUP)
+        return events
+
+    def run(self, policy, max_frames: int = 100_000) -> int:
+        """
+        Plays until game over or max_frames, asking policy(simulation) each
+        frame whether to flap. Returns the final score.
+        """
+        while not self.done and self.game_state.frame_count < max_frames:
+            self.step(policy(self))
+        return self.game_state.score
@@ -1,12 +1,12 @@
 """
 star.py
 
-Defines the Star class for background effects.
+Defines the Star class and the layered StarField for background effects.
 """
 
 import pygame
 import random
-from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT, STAR_LAYERS, BLACK
 
 
 class Star:
@@ -14,12 +14,15 @@ class Star:
     Represents a star in the background.
     """
 
+    __slots__ = ("x", "y", "size", "speed")
+
+    color = (255, 255, 255)
+
     def __init__(self):
         self.x = random.randint(0, SCREEN_WIDTH)
         self.y = random.randint(0, SCREEN_HEIGHT)
         self.size = random.randint(1, 3)
         self.speed = random.uniform(0.5, 1.5)
-        self.color = (255, 255, 255)
 
     def update(self):
         """
@@ -35,3 +38,67 @@ class Star:
         Draw the star on the screen.
         """
         pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), self.size)
+
+
+class StarField:
+    """
+    A parallax star field pre-rendered into a few wrapping layer surfaces.
+
+    Each layer scrolls at its own speed and is drawn with two blits, so the
+    per-frame cost does not depend on the number of stars.
+    """
+
+    def __init__(self, count: int, layers: int = STAR_LAYERS, rng=random) -> None:
+        self.count = count
+        # Layer speeds range from 0.5 (far) to 1.5 (near) pixels per frame
+        self.speeds = [0.5 + i / max(layers - 1, 1) for i in range(layers)]
+        self.offsets = [0.0] * layers
+        self.stars = [[] for _ in range(layers)]
+        for _ in range(count):
+            layer = rng.randrange(layers)
+            self.stars[layer].append(
+                (
+                    rng.randint(0, SCREEN_WIDTH),
+                    rng.randint(0, SCREEN_HEIGHT),
+                    rng.randint(1, 3),
+                )
+            )
+        self._surfaces = None
+
+    def update(self):
+        """
+        Scroll every layer by its speed.
+        """
+        for i, speed in enumerate(self.speeds):
+            self.offsets[i] = (self.offsets[i] + speed) % SCREEN_WIDTH
+
+    def render_layers(self):
+        """
+        Pre-render each layer's stars onto a colorkeyed screen-sized surface.
+        Stars crossing the left or right edge are drawn on both sides so the
+        layer wraps seamlessly.
+        """
+        surfaces = []
+        for stars in self.stars:
+            surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            surface.set_colorkey(BLACK, pygame.RLEACCEL)
+            for x, y, size in stars:
+                for wrapped_x in (x - SCREEN_WIDTH, x, x + SCREEN_WIDTH):
+                    if -size <= wrapped_x <= SCREEN_WIDTH + size:
+                        pygame.draw.circle(
+                            surface, (255, 255, 255), (wrapped_x, y), size
+                        )
+            surfaces.append(surface)
+        return surfaces
+
+    def draw(self, screen, alpha=1.0):
+        """
+        Draw the star field on the screen. alpha interpolates between the
+        previous (0) and current (1) scroll offsets.
+        """
+        if self._surfaces is None:
+            self._surfaces = self.render_layers()
+        for surface, offset, speed in zip(self._surfaces, self.offsets, self.speeds):
+            x = -int((offset + speed * (alpha - 1)) % SCREEN_WIDTH)
+            screen.blit(surface, (x, 0))
+            screen.blit(surface, (x + SCREEN_WIDTH, 0))
@@ -0,0 +1,74 @@
+"""
+state.py
+
+Defines the GameState record shared by the game loop, scenes and simulation.
+"""
+
+# The states a game moves through; each has a scene in utils.scenes
+STATE_START = "start"
+STATE_LEVEL_SELECT = "level_select"
+STATE_PLAYING = "playing"
+STATE_GAME_OVER = "game_over"
+
+
+class GameState:
+    """
+    The state of a session: which scene is active, the game in progress and
+    session-wide fields such as the high score.
+    """
+
+    __slots__ = (
+        "state",
+        "score",
+        "high_score",
+        "start_time",
+        "frame_count",
+        "reset",
+        "level",
+        "gravity",
+        "flap_strength",
+        "theme",
+        "current_background",
+        "score_saved",
+        "leaderboard",
+        "cause_of_death",
+        "show_frame_stats",
+        "frame_stats",
+        "demo",
+    )
+
+    def __init__(
+        self,
+        state: str = STATE_START,
+        level: str = None,
+        gravity: float = 0.5,
+        flap_strength: float = -10,
+        high_score: int = 0,
+        show_frame_stats: bool = False,
+    ) -> None:
+        self.high_score = high_score
+        self.gravity = gravity
+        self.flap_strength = flap_strength
+        self.show_frame_stats = show_frame_stats
+        self.frame_stats = None
+        self.demo = None  # The attract-mode demo behind the menus, if any
+        self.new_game()
+        self.state = state
+        self.level = level
+
+    def new_game(self) -> None:
+        """
+        Return to the start screen for a new game, keeping the session-wide
+        fields.
+        """
+        self.state = STATE_START
+        self.score = 0
+        self.start_time = None
+        self.frame_count = 0
+        self.reset = False
+        self.level = None
+        self.theme = None
+        self.current_background = None
+        self.score_saved = False
+        self.leaderboard = []
+        self.cause_of_death = None
@@ -4,140 +4,252 @@ main.py
 Entry point of the game. Initializes and runs the game loop.
 """
 
+import argparse
+import atexit
 import pygame
+import random
 import sys
-import os
-from config.settings import FPS, SCREEN_WIDTH, SCREEN_HEIGHT
+import time
+from config.settings import (
+    FPS,
+    RENDER_FPS,
+    MAX_SIM_STEPS_PER_FRAME,
+    SHOW_FRAME_STATS,
+    SCREEN_WIDTH,
+    SCREEN_HEIGHT,
+    PROFILES,
+    STAR_COUNT,
+    THEME_STAR_COUNTS,
+    DIRTY_RECT_RENDERING,
+    RNG_SEED,
+    ATTRACT_MODE,
+    TELEMETRY_DIR,
+)
+from game.attract import AttractMode
+from game.background import Backgrounds
 from game.bird import Bird
+from game.course import daily_seed, next_course
 from game.obstacle import Obstacle
-from game.star import Star
+from game.pool import EntityPool
+from game.star import StarField
+from game.state import GameState, STATE_GAME_OVER
+from game.particle import ParticleSystem
 from game.powerup import PowerUp
-from game.particle import Particle
-from utils.helpers import handle_events, update_game, draw_game
-from utils.high_score import load_high_score, save_high_score
-
-
-def main():
+from utils.helpers import (
+    handle_events,
+    update_game,
+    draw_game,
+)
+from utils.assets import assets
+from utils.audio import AudioEngine, NullAudio
+from utils.renderer import DirtyRectRenderer, FullRenderer
+from utils.timestep import FixedTimestep
+from utils.profiler import profiler
+from utils.high_score import score_store
+from utils.telemetry import telemetry
+
+
+def main(seed=None, record_path=None, replay_path=None, telemetry_dir=None):
     """
-    Main function to run the game.
+    Main function to run the game. The seed fixes the sequence of courses
+    played; record_path saves the inputs and replay_path plays a saved
+    recording back at full speed.
     """
-    # Initialize Pygame modules
+    # Initialize Pygame modules (a missing audio device leaves the mixer off)
     pygame.init()
-    pygame.mixer.init()  # Initialize the mixer module for sounds
 
     # Set up the display
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption("Sci-Fi Flappy Bird")
 
+    # Choose how frames reach the display
+    renderer = DirtyRectRenderer() if DIRTY_RECT_RENDERING else FullRenderer()
+
     # Clock to control the frame rate
     clock = pygame.time.Clock()
 
-    # Load sounds
-    flap_sound = pygame.mixer.Sound(os.path.join("assets", "sounds", "flap.mp3"))
-    score_sound = pygame.mixer.Sound(os.path.join("assets", "sounds", "score.mp3"))
-    game_over_sound = pygame.mixer.Sound(
-        os.path.join("assets", "sounds", "game_over.mp3")
+    # Decode the backgrounds and sprites on a background thread while
+    # the start screen is up; each is picked up on first use
+    assets.preload(
+        images=[
+            *filter(None, (theme.background for theme in PROFILES.themes.values())),
+            "phoenix.png",
+            *(f"{kind}.png" for kind in PowerUp.TYPES),
+        ],
     )
 
-    # Load background images
-    background_images = {
-        "space": pygame.image.load(
-            os.path.join("assets", "images", "bg-space.png")
-        ).convert(),
-        "nebula": pygame.image.load(
-            os.path.join("assets", "images", "bg-nebula.png")
-        ).convert(),
-        "planet": pygame.image.load(
-            os.path.join("assets", "images", "bg-planet.png")
-        ).convert(),
-    }
-
-    # Initialize game variables
-    default_gravity = 0.5
-    default_flap_strength = -10
-
-    # Load high score
-    high_score = load_high_score()
-
-    # Game state dictionary
-    game_state = {
-        "state": "start",
-        "score": 0,
-        "high_score": high_score,
-        "start_time": None,
-        "frame_count": 0,
-        "reset": False,
-        "level": None,
-        "gravity": default_gravity,
-        "flap_strength": default_flap_strength,
-        "theme": None,
-        "current_background": None,
-        "score_saved": False,
-    }
+    # A theme without a background image (the space theme has none) is drawn
+    # as plain black behind the star field
+    backgrounds = Backgrounds(PROFILES.themes)
+
+    # Load the high score and leaderboards; scores are saved in the background
+    score_store.open()
+    atexit.register(score_store.close)
+    high_score = score_store.high_score
+
+    # Session state, starting on the title screen
+    game_state = GameState(high_score=high_score, show_frame_stats=SHOW_FRAME_STATS)
+    if ATTRACT_MODE:
+        game_state.demo = AttractMode()
+
+    # The replay module is only needed for recording and replaying
+    if record_path or replay_path:
+        from game.replay import InputRecorder, Recording
+
+    # Sound effects play on reserved channels; replays run silent, as does a
+    # machine without an audio device
+    if replay_path or not pygame.mixer.get_init():
+        audio = NullAudio()
+    else:
+        audio = AudioEngine()
+    audio.open()
+
+    # Seed the game's random stream; a replay reuses the recorded seed
+    replay = Recording.load(replay_path) if replay_path else None
+    if replay is not None:
+        seed = replay.seed
+    elif seed is None:
+        seed = RNG_SEED if RNG_SEED is not None else random.randrange(2**63)
+    rng = random.Random(seed)
+    course = next_course(rng)
+
+    # Log telemetry for long unattended sessions if asked to
+    telemetry_dir = telemetry_dir or TELEMETRY_DIR
+    if telemetry_dir:
+        telemetry.open(telemetry_dir, seed=seed)
+        atexit.register(telemetry.close)
+
+    # Record the game's inputs if asked to
+    recorder = InputRecorder(record_path, seed) if record_path else None
+    if recorder is not None:
+        atexit.register(recorder.close)
 
     # Initialize game objects
-    bird = Bird(game_state["gravity"], game_state["flap_strength"])
-    obstacles = []
-    stars = [Star() for _ in range(50)]
-    particles = []
-    powerups = []
+    bird = Bird(game_state.gravity, game_state.flap_strength)
+    obstacles = EntityPool(lambda: Obstacle(SCREEN_WIDTH))
+    stars = StarField(STAR_COUNT)
+    particles = ParticleSystem(seed=seed)
+    powerups = EntityPool(lambda: PowerUp(SCREEN_WIDTH))
+
+    # Fixed-timestep clock driving the simulation
+    timestep = FixedTimestep(FPS, MAX_SIM_STEPS_PER_FRAME)
 
     # Main game loop
+    steps_run = 0
     running = True
     while running:
-        clock.tick(FPS)
-
-        # Update frame count
-        game_state["frame_count"] += 1
+        if replay is not None:
+            # Replays run one step per frame as fast as possible, feeding the
+            # recorded keys in place of the keyboard
+            clock.tick()
+            if steps_run >= replay.steps:
+                break
+            elapsed = timestep.step_time
+            pygame.event.clear(pygame.KEYDOWN)
+            for key in replay.inputs.get(steps_run, ()):
+                pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key))
+        else:
+            elapsed = clock.tick(RENDER_FPS) / 1000  # Seconds since last frame
 
         # Handle events
-        handle_events(bird, game_state, background_images, flap_sound)
+        with profiler.section("events"):
+            handle_events(bird, game_state, backgrounds, audio, recorder)
+
+        # Match the star field density to the chosen theme
+        star_count = THEME_STAR_COUNTS.get(game_state.theme, STAR_COUNT)
+        if stars.count != star_count:
+            stars = StarField(star_count)
 
         # Update game objects and state
-        if game_state["reset"]:
+        if game_state.reset:
             # Reset the game
-            bird = Bird(game_state["gravity"], game_state["flap_strength"])
-            obstacles = []
-            stars = [Star() for _ in range(50)]
-            particles = []
-            powerups = []
-            game_state["score"] = 0
-            game_state["frame_count"] = 0
-            game_state["state"] = "start"
-            game_state["reset"] = False
-            game_state["level"] = None
-            game_state["theme"] = None
-            game_state["current_background"] = None
-            game_state["score_saved"] = False
-            game_state["start_time"] = pygame.time.get_ticks()
-        else:
-            update_game(
+            bird = Bird(game_state.gravity, game_state.flap_strength)
+            obstacles.clear()
+            stars = StarField(STAR_COUNT)
+            particles.clear()
+            powerups.clear()
+            course = next_course(rng)
+            game_state.new_game()
+
+        # Run as many fixed simulation steps as real time calls for
+        sim_start = time.perf_counter()
+        sim_steps = timestep.advance(elapsed)
+        with profiler.section("update"):
+            for _ in range(sim_steps):
+                game_state.frame_count += 1
+                update_game(
+                    bird,
+                    obstacles,
+                    stars,
+                    game_state,
+                    particles,
+                    powerups,
+                    audio,
+                    course,
+                )
+                steps_run += 1
+                if recorder is not None:
+                    recorder.step += 1
+        sim_end = time.perf_counter()
+
+        # Save the score if game over
+        if game_state.state == STATE_GAME_OVER and not game_state.score_saved:
+            theme, level = game_state.theme, game_state.level
+            if replay is None:
+                # A replayed game was already submitted when it was recorded
+                score_store.submit(theme, level, game_state.score)
+            game_state.high_score = score_store.high_score
+            game_state.leaderboard = score_store.leaderboard(theme, level)[:3]
+            game_state.score_saved = True
+
+        # Draw everything
+        with profiler.section("draw"):
+            draw_game(
+                screen,
                 bird,
                 obstacles,
                 stars,
                 game_state,
                 particles,
                 powerups,
-                score_sound,
-                game_over_sound,
-                FPS,
+                renderer,
+                timestep.alpha,
             )
-
-        # Save high score if game over
-        if game_state["state"] == "game_over" and not game_state.get(
-            "score_saved", False
-        ):
-            if game_state["score"] > game_state["high_score"]:
-                game_state["high_score"] = game_state["score"]
-                save_high_score(game_state["high_score"])
-            game_state["score_saved"] = True
-
-        # Draw everything
-        draw_game(screen, bird, obstacles, stars, game_state, particles, powerups)
-
+        frame_end = time.perf_counter()
+        game_state.frame_stats = {
+            "fps": clock.get_fps(),
+            "sim_steps": sim_steps,
+            "sim_ms": (sim_end - sim_start) * 1000,
+            "render_ms": (frame_end - sim_end) * 1000,
+        }
+        profiler.end_frame()
+        telemetry.end_frame(frame_end - sim_start, obstacles, particles, powerups)
+
+    if recorder is not None:
+        recorder.close()
+    score_store.close()
+    telemetry.close()
     pygame.quit()
     sys.exit()
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Sci-Fi Flappy Bird")
+    parser.add_argument("--seed", type=int, help="seed for the courses played")
+    parser.add_argument(
+        "--daily", action="store_true", help="play today's shared courses"
+    )
+    parser.add_argument("--record", metavar="FILE", help="record inputs to FILE")
+    parser.add_argument("--replay", metavar="FILE", help="replay inputs from FILE")
+    parser.add_argument(
+        "--telemetry", metavar="DIR", help="log session telemetry to DIR"
+    )
+    args = parser.parse_args()
+    if args.daily:
+        args.seed = daily_seed()
+    main(
+        seed=args.seed,
+        record_path=args.record,
+        replay_path=args.replay,
+        telemetry_dir=args.telemetry,
+    )
@@ -0,0 +1,30 @@
+"""
+test_allocations.py
+
+Checks that a long headless session holds no more memory the longer it runs.
+"""
+
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from benchmarks.bench_allocations import measure, FRAMES, MAX_GROWTH_BYTES
+
+
+class AllocationTest(unittest.TestCase):
+    def test_no_growth_per_frame(self):
+        sim, stats, _ = measure(FRAMES)
+        growth = sum(stat.size_diff for stat in stats)
+        top = "\n".join(str(stat) for stat in stats[:5])
+        self.assertLessEqual(
+            growth,
+            MAX_GROWTH_BYTES,
+            f"grew {growth} bytes over {FRAMES} frames:\n{top}",
+        )
+        self.assertFalse(sim.done)
+
+
+if __name__ == "__main__":
+    unittest.main()
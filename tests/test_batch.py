@@ -0,0 +1,77 @@
+"""
+test_batch.py
+
+Checks that every bird of a BatchSimulation plays exactly the game a single
+Simulation plays with the same seed and policy.
+"""
+
+import os
+import unittest
+from unittest import mock
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+from game import course
+from game.batch import BatchSimulation, BIRD_X
+from game.simulation import Simulation
+
+SEED = 7
+LEVELS = ("easy", "medium", "hard")
+MAX_FRAMES = 3_000
+OFFSETS = np.arange(-30, 60, 3)  # Each bird aims this far below the gap centre
+
+
+def target(dx, gap_top, gap_bottom, offset):
+    """
+    The height a bird aims for: the centre of the next gap once it is near.
+    """
+    return np.where(dx < 400, (gap_top + gap_bottom) / 2, 350) + offset
+
+
+class BatchSimulationTest(unittest.TestCase):
+    def setUp(self):
+        # Batch birds ignore power-ups, so play courses without them. The
+        # course cache is cleared so no course generated with them is reused
+        patch = mock.patch.object(course, "POWERUP_SPAWN_INTERVAL", 10**9)
+        patch.start()
+        self.addCleanup(patch.stop)
+        course.course_cache.clear()
+        self.addCleanup(course.course_cache.clear)
+
+    def play_single(self, level, offset):
+        sim = Simulation(level, seed=SEED)
+
+        def policy(sim):
+            bird = sim.bird
+            ahead = next(
+                (o for o in sim.obstacles if o.x + o.width > bird.x - bird.width // 2),
+                None,
+            )
+            if ahead is None:
+                aim = 350 + offset
+            else:
+                aim = target(ahead.x - BIRD_X, ahead.top_height, ahead.bottom_y, offset)
+            return bird.y > aim and bird.velocity > -2
+
+        sim.run(policy, MAX_FRAMES)
+        return sim.game_state.score, sim.game_state.frame_count
+
+    def test_birds_match_single_simulations(self):
+        for level in LEVELS:
+            batch = BatchSimulation(len(OFFSETS), level, seed=SEED)
+            observations = batch.reset()
+            while not batch.done and batch.frame_count < MAX_FRAMES:
+                aim = target(*observations[:, 2:5].T, OFFSETS)
+                observations, *_ = batch.step((batch.y > aim) & (batch.velocity > -2))
+            for i, offset in enumerate(OFFSETS):
+                with self.subTest(level=level, offset=offset):
+                    self.assertEqual(
+                        self.play_single(level, offset),
+                        (batch.scores[i], batch.frames_survived[i]),
+                    )
+
+
+if __name__ == "__main__":
+    unittest.main()
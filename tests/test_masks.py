@@ -0,0 +1,44 @@
+"""
+test_masks.py
+
+Checks that the collision masks shipped in assets/masks match the sprites
+and spare headless games from decoding them.
+"""
+
+import os
+import unittest
+from unittest import mock
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from game.runner import gap_policy
+from game.simulation import Simulation
+from utils.assets import AssetManager, assets, build_mask, read_mask
+from utils.make_masks import SPRITES
+
+
+class ShippedMaskTest(unittest.TestCase):
+    def test_masks_match_sprites(self):
+        manager = AssetManager()
+        for name, size in SPRITES:
+            with self.subTest(name=name):
+                built = build_mask(manager.image(name, size))
+                shipped = read_mask(manager.mask_path(name, size))
+                self.assertEqual(shipped.get_size(), built.get_size())
+                self.assertEqual(shipped.count(), built.count())
+                self.assertEqual(shipped.overlap_area(built, (0, 0)), built.count())
+
+    def test_headless_game_decodes_no_images(self):
+        decode = mock.Mock(side_effect=AssertionError("decoded an image"))
+        with mock.patch.object(assets, "_masks", {}), mock.patch.object(
+            assets, "image", decode
+        ):
+            for seed in range(5):
+                sim = Simulation("hard", seed=seed)
+                sim.run(gap_policy, 2_000)
+        decode.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,201 @@
+"""
+assets.py
+
+Loads images and sounds once and hands out shared, cached copies.
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+from config.settings import MASK_THRESHOLD
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets")
+
+
+class AssetManager:
+    """
+    A registry of decoded assets.
+
+    Each image is decoded and converted once; scaled variants are cached by
+    size, so every caller asking for the same image and size shares a single
+    surface. preload() decodes files on a background thread ahead of use.
+    The time the caller spent loading each asset is recorded in load_times.
+    """
+
+    def __init__(self, root: str = ASSETS_DIR) -> None:
+        self.root = root
+        self.load_times = {}
+        self._images = {}
+        self._sounds = {}
+        self._fonts = {}
+        self._masks = {}
+        self._pending = {}
+        self._loader = None
+
+    def preload(self, images=(), sounds=()) -> None:
+        """
+        Start decoding the named images and sounds on a background thread.
+        image() and sound() pick up the results, waiting only for files that
+        are not decoded yet. Sounds need the mixer to be initialized.
+        """
+        if self._loader is None:
+            self._loader = ThreadPoolExecutor(1, thread_name_prefix="assets")
+        for name in images:
+            key = ("images", name)
+            if key not in self._pending and (name, None, True) not in self._images:
+                path = os.path.join(self.root, "images", name)
+                self._pending[key] = self._loader.submit(pygame.image.load, path)
+        for name in sounds:
+            key = ("sounds", name)
+            if key not in self._pending and name not in self._sounds:
+                path = os.path.join(self.root, "sounds", name)
+                self._pending[key] = self._loader.submit(pygame.mixer.Sound, path)
+
+    def _load(self, kind: str, name: str, load):
+        """
+        Return the preloaded image or sound, or load it now with load(path).
+        """
+        future = self._pending.pop((kind, name), None)
+        if future is not None:
+            return future.result()
+        return load(os.path.join(self.root, kind, name))
+
+    def image(self, name: str, size=None, alpha: bool = True):
+        """
+        Return the image assets/images/<name>, scaled to size if given.
+        Raises FileNotFoundError or pygame.error if it cannot be loaded.
+        """
+        key = (name, size, alpha)
+        image = self._images.get(key)
+        if image is not None:
+            return image
+
+        if size is None:
+            start = time.perf_counter()
+            image = self._load("images", name, pygame.image.load)
+            # Converting needs a display; headless callers get the raw surface
+            if pygame.display.get_surface() is not None:
+                image = image.convert_alpha() if alpha else image.convert()
+        else:
+            original = self.image(name, alpha=alpha)
+            start = time.perf_counter()
+            image = pygame.transform.scale(original, size)
+        self._images[key] = image
+        self.load_times[key] = time.perf_counter() - start
+        return image
+
+    def mask(self, name: str, size=None):
+        """
+        Return the collision mask of the image at size, cached once made.
+        Masks shipped in assets/masks are read from there, so headless games
+        never decode the sprites; others are built from the image.
+        """
+        key = (name, size)
+        mask = self._masks.get(key)
+        if mask is None:
+            path = size and self.mask_path(name, size)
+            if path and os.path.exists(path):
+                mask = read_mask(path)
+            else:
+                mask = build_mask(self.image(name, size))
+            self._masks[key] = mask
+        return mask
+
+    def mask_path(self, name: str, size) -> str:
+        """
+        Return the path of the shipped mask of image name at size.
+        """
+        stem = os.path.splitext(name)[0]
+        return os.path.join(self.root, "masks", f"{stem}-{size[0]}x{size[1]}.txt")
+
+    def sound(self, name: str):
+        """
+        Return the sound assets/sounds/<name>.
+        """
+        sound = self._sounds.get(name)
+        if sound is None:
+            start = time.perf_counter()
+            sound = self._load("sounds", name, pygame.mixer.Sound)
+            self._sounds[name] = sound
+            self.load_times[name] = time.perf_counter() - start
+        return sound
+
+    def font(self, name: str, size: int):
+        """
+        Return the system font name at size, starting the font module on
+        first use so importing the game does not pay for it.
+        """
+        key = (name, size)
+        font = self._fonts.get(key)
+        if font is None:
+            start = time.perf_counter()
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = pygame.font.SysFont(name, size)
+            self._fonts[key] = font
+            self.load_times[key] = time.perf_counter() - start
+        return font
+
+    @property
+    def total_load_time(self) -> float:
+        """
+        Seconds spent loading every asset so far.
+        """
+        return sum(self.load_times.values())
+
+    def report(self) -> str:
+        """
+        Describe the load time of each asset, slowest first.
+        """
+        lines = [
+            f"{elapsed * 1000:8.2f} ms  {key}"
+            for key, elapsed in sorted(
+                self.load_times.items(), key=lambda item: item[1], reverse=True
+            )
+        ]
+        lines.append(f"{self.total_load_time * 1000:8.2f} ms  total")
+        return "\n".join(lines)
+
+
+def build_mask(image):
+    """
+    Return the collision mask of image. An image with no transparent pixels
+    is taken to be a sprite on a plain background, and pixels within
+    MASK_THRESHOLD of its top-left colour are left out.
+    """
+    mask = pygame.mask.from_surface(image)
+    if mask.count() == mask.get_size()[0] * mask.get_size()[1]:
+        threshold = (MASK_THRESHOLD, MASK_THRESHOLD, MASK_THRESHOLD, 255)
+        mask = pygame.mask.from_threshold(image, image.get_at((0, 0)), threshold)
+        mask.invert()
+    return mask
+
+
+def read_mask(path: str):
+    """
+    Read a mask written by write_mask.
+    """
+    with open(path) as file:
+        rows = file.read().split()
+    mask = pygame.mask.Mask((len(rows[0]), len(rows)))
+    for y, row in enumerate(rows):
+        for x, cell in enumerate(row):
+            if cell == "#":
+                mask.set_at((x, y))
+    return mask
+
+
+def write_mask(mask, path: str) -> None:
+    """
+    Write mask as text, one line per row with # for solid pixels.
+    """
+    width, height = mask.get_size()
+    with open(path, "w") as file:
+        for y in range(height):
+            row = "".join("#" if mask.get_at((x, y)) else "." for x in range(width))
+            file.write(row + "\n")
+
+
+# Shared registry used by the game
+assets = AssetManager()
@@ -0,0 +1,88 @@
+"""
+audio.py
+
+Plays the game's sound effects on reserved mixer channels.
+"""
+
+import time
+import pygame
+from config.settings import SOUND_EFFECTS
+from utils.assets import assets
+
+
+class AudioEngine:
+    """
+    Plays sound effects by name, as configured in SOUND_EFFECTS.
+
+    Each effect gets its own reserved mixer channels, so a burst of one
+    effect can only cut off its own earlier plays, never another effect.
+    Plays that come sooner than the effect's min_interval_ms after the last
+    one are dropped. Sounds are decoded once, on the asset loader thread.
+    """
+
+    def __init__(self, effects: dict = SOUND_EFFECTS) -> None:
+        self.effects = effects
+        self.dropped = 0
+        self._sounds = {}
+        self._channels = {}
+        self._next_channel = {}
+        self._last_played = {}
+        self._min_interval = {}
+
+    def open(self) -> None:
+        """
+        Reserve the channels of every effect and start decoding the sounds.
+        The mixer must already be initialized.
+        """
+        reserved = sum(effect["channels"] for effect in self.effects.values())
+        if pygame.mixer.get_num_channels() < reserved:
+            pygame.mixer.set_num_channels(reserved)
+        pygame.mixer.set_reserved(reserved)
+
+        first = 0
+        for name, effect in self.effects.items():
+            count = effect["channels"]
+            self._channels[name] = [
+                pygame.mixer.Channel(i) for i in range(first, first + count)
+            ]
+            self._next_channel[name] = 0
+            self._last_played[name] = float("-inf")
+            self._min_interval[name] = effect["min_interval_ms"] / 1000
+            first += count
+        assets.preload(sounds=[effect["file"] for effect in self.effects.values()])
+
+    def play(self, name: str) -> None:
+        """
+        Play the named effect, unless it played less than its minimum
+        interval ago.
+        """
+        now = time.perf_counter()
+        if now - self._last_played[name] < self._min_interval[name]:
+            self.dropped += 1
+            return
+        self._last_played[name] = now
+
+        sound = self._sounds.get(name)
+        if sound is None:
+            sound = self._sounds[name] = assets.sound(self.effects[name]["file"])
+
+        # Rotate through the effect's channels, replacing its oldest play
+        channels = self._channels[name]
+        index = self._next_channel[name]
+        self._next_channel[name] = (index + 1) % len(channels)
+        channels[index].play(sound)
+
+
+class NullAudio:
+    """
+    Stands in for the audio engine when there is no mixer, and in headless
+    runs and replays, so no time is spent on sound.
+    """
+
+    dropped = 0
+
+    def open(self) -> None:
+        pass
+
+    def play(self, name: str) -> None:
+        pass
@@ -1,24 +1,157 @@
 """
 high_score.py
 
-Handles loading and saving the high score.
+Handles loading and saving the high score and the per-theme leaderboards.
 """
 
+import os
+import queue
+import sqlite3
+import threading
+import time
+from config.settings import LEADERBOARD_SIZE
 
-def load_high_score() -> None:
+SAVE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HIGH_SCORE_FILE = os.path.join(SAVE_DIR, "high_score.txt")
+LEADERBOARD_FILE = os.path.join(SAVE_DIR, "scores.db")
+
+
+def load_high_score(path: str = HIGH_SCORE_FILE) -> int:
     """
     Load the high score from a file.
     """
     try:
-        with open("high_score.txt", "r") as file:
+        with open(path, "r") as file:
             return int(file.read())
-    except FileNotFoundError:
+    except (FileNotFoundError, ValueError):
         return 0
 
 
-def save_high_score(score: int) -> None:
+def save_high_score(score: int, path: str = HIGH_SCORE_FILE) -> None:
     """
-    Save the high score to a file.
+    Save the high score to a file. The score is written to a temporary file
+    that then replaces the old one, so a crash never leaves it truncated.
     """
-    with open("high_score.txt", "w") as file:
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w") as file:
         file.write(str(score))
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_path, path)
+
+
+class ScoreStore:
+    """
+    Keeps the high score and a top-LEADERBOARD_SIZE leaderboard for each
+    (theme, level) in an SQLite database in WAL mode.
+
+    Leaderboards are read once into memory by open(), and submit() updates
+    them there straight away; the database and high score file are written
+    by a background thread, so saving a score never stalls a frame.
+    """
+
+    def __init__(
+        self, path: str = LEADERBOARD_FILE, high_score_path: str = HIGH_SCORE_FILE
+    ) -> None:
+        self.path = path
+        self.high_score_path = high_score_path
+        self.high_score = 0
+        self._leaderboards = {}
+        self._queue = queue.Queue()
+        self._thread = None
+
+    def open(self) -> None:
+        """
+        Load the high score and leaderboards and start the writer thread.
+        """
+        self.high_score = load_high_score(self.high_score_path)
+        connection = self._connect()
+        rows = connection.execute(
+            "SELECT theme, level, score FROM scores ORDER BY score DESC"
+        ).fetchall()
+        connection.close()
+        self._leaderboards.clear()
+        for theme, level, score in rows:
+            self._leaderboards.setdefault((theme, level), []).append(score)
+        self._thread = threading.Thread(
+            target=self._write_loop, name="score-writer", daemon=True
+        )
+        self._thread.start()
+
+    def leaderboard(self, theme: str, level: str) -> list:
+        """
+        Return the best scores for theme and level, highest first.
+        """
+        return self._leaderboards.get((theme, level), [])
+
+    def submit(self, theme: str, level: str, score: int) -> bool:
+        """
+        Record a finished game and return whether it set a new high score.
+        """
+        scores = self._leaderboards.setdefault((theme, level), [])
+        scores.append(score)
+        scores.sort(reverse=True)
+        del scores[LEADERBOARD_SIZE:]
+
+        new_high_score = score > self.high_score
+        if new_high_score:
+            self.high_score = score
+        self._queue.put((theme, level, score, new_high_score))
+        return new_high_score
+
+    def close(self) -> None:
+        """
+        Wait for the pending writes to finish and stop the writer thread.
+        """
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def _connect(self):
+        """
+        Open the database, creating the table and index on first use.
+        """
+        connection = sqlite3.connect(self.path)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS scores ("
+            "theme TEXT NOT NULL, level TEXT NOT NULL, "
+            "score INTEGER NOT NULL, recorded REAL NOT NULL)"
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS scores_board "
+            "ON scores (theme, level, score DESC)"
+        )
+        return connection
+
+    def _write_loop(self) -> None:
+        """
+        Write queued scores until close() is called.
+        """
+        connection = self._connect()
+        while True:
+            entry = self._queue.get()
+            if entry is None:
+                break
+            theme, level, score, new_high_score = entry
+            if new_high_score:
+                save_high_score(score, self.high_score_path)
+            with connection:
+                connection.execute(
+                    "INSERT INTO scores VALUES (?, ?, ?, ?)",
+                    (theme, level, score, time.time()),
+                )
+                # Keep only the top scores of this leaderboard
+                connection.execute(
+                    "DELETE FROM scores WHERE theme = ? AND level = ? AND rowid "
+                    "NOT IN (SELECT rowid FROM scores WHERE theme = ? AND "
+                    "level = ? ORDER BY score DESC LIMIT ?)",
+                    (theme, level, theme, level, LEADERBOARD_SIZE),
+                )
+        connection.close()
+
+
+# Shared store used by the game loop
+score_store = ScoreStore()
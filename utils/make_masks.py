@@ -0,0 +1,31 @@
+"""
+make_masks.py
+
+Writes the collision masks shipped in assets/masks, so headless games need
+not decode the sprites. Run from the project root after changing a sprite:
+
+    python -m utils.make_masks
+"""
+
+import os
+from game.bird import Bird
+from game.powerup import PowerUp
+from utils.assets import AssetManager, build_mask, write_mask
+
+# The sprites collisions are tested with, at the size they are drawn
+SPRITES = [("phoenix.png", (Bird.width, Bird.height))] + [
+    (f"{kind}.png", (PowerUp.width, PowerUp.height)) for kind in PowerUp.TYPES
+]
+
+
+def main():
+    manager = AssetManager()
+    for name, size in SPRITES:
+        path = manager.mask_path(name, size)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        write_mask(build_mask(manager.image(name, size)), path)
+        print(f"wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
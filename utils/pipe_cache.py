@@ -0,0 +1,146 @@
+"""
+pipe_cache.py
+
+Renders textured pipe surfaces once per theme colour and caches the slices
+drawn at each height.
+"""
+
+import math
+from collections import OrderedDict
+import pygame
+from config.settings import SCREEN_HEIGHT, OBSTACLE_WIDTH, PIPE_CACHE_SIZE
+
+CAP_HEIGHT = 24  # The rim at the open end of each pipe
+PANEL_HEIGHT = 40  # Spacing of the seams between hull panels
+
+
+def shade(color, factor: float):
+    """
+    Scale an (r, g, b) colour by factor, clamped to the valid range.
+    """
+    return tuple(max(0, min(255, round(c * factor))) for c in color)
+
+
+class PipeCache:
+    """
+    Textured pipe surfaces. A full-height body and a cap are rendered once
+    per colour; each top or bottom pipe is then sliced from the body at its
+    height with the cap on its open end, and the slices are kept in a
+    least-recently-used cache keyed by (color, height, end).
+    """
+
+    def __init__(self, max_size: int = PIPE_CACHE_SIZE, width: int = OBSTACLE_WIDTH):
+        self.max_size = max_size
+        self.width = width
+        self.hits = 0
+        self.misses = 0
+        self._textures = {}
+        self._slices = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._slices)
+
+    def top(self, color, height: int):
+        """
+        Return the surface of a top pipe of height, capped at its bottom.
+        """
+        return self._slice(color, max(0, int(height)), True)
+
+    def bottom(self, color, height: int):
+        """
+        Return the surface of a bottom pipe of height, capped at its top.
+        """
+        return self._slice(color, max(0, int(height)), False)
+
+    def _slice(self, color, height: int, top: bool):
+        key = (color, height, top)
+        surface = self._slices.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._slices.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        body, cap = self.textures(color)
+        surface = pygame.Surface((self.width, height))
+        if top:
+            surface.blit(body, (0, 0), (0, SCREEN_HEIGHT - height, self.width, height))
+            surface.blit(cap, (0, height - CAP_HEIGHT))
+        else:
+            surface.blit(body, (0, 0), (0, 0, self.width, height))
+            surface.blit(pygame.transform.flip(cap, False, True), (0, 0))
+        surface = _convert(surface)
+        self._slices[key] = surface
+        if len(self._slices) > self.max_size:
+            self._slices.popitem(last=False)
+        return surface
+
+    def textures(self, color):
+        """
+        Return the (body, cap) surfaces for color, rendering them on first
+        use. The cap's glowing rim is along its bottom edge.
+        """
+        textures = self._textures.get(color)
+        if textures is None:
+            textures = self._textures[color] = (
+                self._render_body(color),
+                self._render_cap(color),
+            )
+        return textures
+
+    def _render_body(self, color):
+        # Shade each column like a lit cylinder, brightest left of centre
+        body = pygame.Surface((self.width, SCREEN_HEIGHT))
+        for x in range(self.width):
+            light = math.sin(math.pi * (x + 0.5) / self.width)
+            highlight = max(0.0, 1 - abs(x - self.width * 0.3) / 6)
+            column = shade(color, 0.35 + 0.65 * light + 0.4 * highlight)
+            pygame.draw.line(body, column, (x, 0), (x, SCREEN_HEIGHT - 1))
+
+        # Panel seams, a dark groove over a lit edge
+        dark, light = shade(color, 0.3), shade(color, 1.2)
+        for y in range(PANEL_HEIGHT, SCREEN_HEIGHT, PANEL_HEIGHT):
+            pygame.draw.line(body, dark, (0, y), (self.width - 1, y))
+            pygame.draw.line(body, light, (0, y + 1), (self.width - 1, y + 1))
+
+        # Darker outline along both sides
+        outline = shade(color, 0.25)
+        pygame.draw.rect(body, outline, (0, 0, 2, SCREEN_HEIGHT))
+        pygame.draw.rect(body, outline, (self.width - 2, 0, 2, SCREEN_HEIGHT))
+        return _convert(body)
+
+    def _render_cap(self, color):
+        cap = pygame.Surface((self.width, CAP_HEIGHT))
+        for x in range(self.width):
+            light = math.sin(math.pi * (x + 0.5) / self.width)
+            column = shade(color, 0.5 + 0.7 * light)
+            pygame.draw.line(cap, column, (x, 0), (x, CAP_HEIGHT - 1))
+        outline = shade(color, 0.25)
+        pygame.draw.rect(cap, outline, cap.get_rect(), 2)
+        # A glowing rim facing the gap
+        pygame.draw.rect(cap, (255, 255, 255), (2, CAP_HEIGHT - 5, self.width - 4, 2))
+        pygame.draw.rect(cap, shade(color, 1.6), (2, CAP_HEIGHT - 3, self.width - 4, 1))
+        return _convert(cap)
+
+    def clear(self) -> None:
+        """
+        Drop every cached surface and reset the counters.
+        """
+        self._textures.clear()
+        self._slices.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+def _convert(surface):
+    """
+    Convert surface to the display format for fast blits, when there is a
+    display.
+    """
+    if pygame.display.get_surface() is not None:
+        return surface.convert()
+    return surface
+
+
+# Shared cache used to draw the obstacles
+pipe_cache = PipeCache()
@@ -0,0 +1,156 @@
+"""
+profiler.py
+
+Times named sections of each frame and reports rolling percentiles.
+"""
+
+import csv
+import json
+import time
+from collections import deque
+from contextlib import nullcontext
+
+PERCENTILES = (50, 95, 99)
+
+
+class _Section:
+    """
+    Context manager that appends the time spent inside it to a sample window.
+    """
+
+    __slots__ = ("samples", "start")
+
+    def __init__(self, samples) -> None:
+        self.samples = samples
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        self.samples.append(time.perf_counter() - self.start)
+
+
+class _Pause:
+    """
+    Context manager that turns a profiler off while inside it.
+    """
+
+    __slots__ = ("profiler",)
+
+    def __init__(self, profiler) -> None:
+        self.profiler = profiler
+
+    def __enter__(self):
+        self.profiler.enabled = False
+
+    def __exit__(self, *exc_info):
+        self.profiler.enabled = True
+
+
+class FrameProfiler:
+    """
+    Collects the duration of named frame sections over a rolling window of
+    frames. While disabled, section() returns a no-op context so the
+    instrumented code costs almost nothing.
+    """
+
+    def __init__(self, window: int = 600, enabled: bool = False) -> None:
+        self.window = window
+        self.enabled = enabled
+        self.frames = 0
+        self._sections = {}
+        self._null = nullcontext()
+        self._pause = _Pause(self)
+        self._overlay_lines = []
+
+    def section(self, name: str):
+        """
+        Return a context manager timing one run of the named section.
+        """
+        if not self.enabled:
+            return self._null
+        section = self._sections.get(name)
+        if section is None:
+            section = self._sections[name] = _Section(deque(maxlen=self.window))
+        return section
+
+    def paused(self):
+        """
+        Return a context manager that stops timing sections inside it, so work
+        nested in one section does not add samples to the sections it reuses.
+        """
+        if not self.enabled:
+            return self._null
+        return self._pause
+
+    def end_frame(self) -> None:
+        """
+        Mark the end of a frame.
+        """
+        if self.enabled:
+            self.frames += 1
+
+    def reset(self) -> None:
+        """
+        Drop every collected sample.
+        """
+        self._sections.clear()
+        self.frames = 0
+        self._overlay_lines = []
+
+    def summary(self) -> dict:
+        """
+        Return {section: {"count", "mean", "p50", "p95", "p99"}} in
+        milliseconds, in the order the sections were first timed.
+        """
+        summary = {}
+        for name, section in self._sections.items():
+            samples = sorted(section.samples)
+            if not samples:
+                continue
+            stats = {
+                "count": len(samples),
+                "mean": sum(samples) / len(samples) * 1000,
+            }
+            for percentile in PERCENTILES:
+                index = round(percentile / 100 * (len(samples) - 1))
+                stats[f"p{percentile}"] = samples[index] * 1000
+            summary[name] = stats
+        return summary
+
+    def overlay_lines(self, refresh: int = 30) -> list:
+        """
+        Return one text line per section for the on-screen overlay. The lines
+        are recomputed every refresh frames so they stay readable and do not
+        force new text renders every frame.
+        """
+        if not self._overlay_lines or self.frames % refresh == 0:
+            self._overlay_lines = [
+                f"{name}: {stats['p50']:.2f} / {stats['p95']:.2f} / "
+                f"{stats['p99']:.2f} ms"
+                for name, stats in self.summary().items()
+            ]
+        return self._overlay_lines
+
+    def dump_json(self, path: str) -> None:
+        """
+        Write the current summary to a JSON file.
+        """
+        with open(path, "w") as file:
+            json.dump(self.summary(), file, indent=2)
+
+    def dump_csv(self, path: str) -> None:
+        """
+        Write the current summary to a CSV file, one row per section.
+        """
+        fields = ["section", "count", "mean"] + [f"p{p}" for p in PERCENTILES]
+        with open(path, "w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=fields)
+            writer.writeheader()
+            for name, stats in self.summary().items():
+                writer.writerow({"section": name, **stats})
+
+
+# Shared profiler used by the game loop
+profiler = FrameProfiler()
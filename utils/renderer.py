@@ -0,0 +1,124 @@
+"""
+renderer.py
+
+Defines how each frame's drawing reaches the display: a full-screen flip or
+updates limited to the regions that changed.
+"""
+
+import pygame
+from config.settings import BLACK
+
+
+class FullRenderer:
+    """
+    Redraws the background and flips the whole display every frame.
+    """
+
+    def begin(self, screen, background, stars, alpha=1.0):
+        """
+        Draw the background and star field for a new frame.
+        """
+        if background is not None:
+            background.draw(screen, alpha)
+        else:
+            screen.fill(BLACK)
+        stars.draw(screen, alpha)
+
+    def add(self, rect, key=None):
+        """
+        Record a drawn region (unused when flipping the whole display).
+        """
+
+    def add_all(self, rects):
+        """
+        Record several drawn regions (unused when flipping the whole display).
+        """
+
+    def present(self):
+        """
+        Show the finished frame.
+        """
+        pygame.display.flip()
+
+
+class DirtyRectRenderer:
+    """
+    Restores and updates only the screen regions that changed since the last
+    frame.
+
+    The background and the star field are composed into a cached surface
+    whenever either of them changes (a theme change, a reset, or the denser
+    star field of the space theme), and that frame is shown with a full
+    flip. The star field and a scrolling
+    background stay still in this mode so they do not dirty the whole screen
+    every frame.
+
+    Each drawn region is recorded with add(). Regions given a key (such as
+    the cached surface of a text label) are only pushed to the display when
+    their key or position changes; regions without a key are always updated.
+    """
+
+    def __init__(self) -> None:
+        self._sources = None
+        self._background = None
+        self._previous = []
+        self._current = []
+        self._full_redraw = True
+
+    def begin(self, screen, background, stars, alpha=1.0):
+        """
+        Erase last frame's regions, or recompose the background if it or
+        the star field changed.
+        """
+        sources = self._sources
+        if sources is None or sources[0] is not background or sources[1] is not stars:
+            self._sources = (background, stars)
+            self._background = pygame.Surface(screen.get_size())
+            if background is not None:
+                background.draw(self._background)
+            else:
+                self._background.fill(BLACK)
+            stars.draw(self._background)
+            screen.blit(self._background, (0, 0))
+            self._full_redraw = True
+        else:
+            for rect, _ in self._previous:
+                screen.blit(self._background, rect, rect)
+        self._current = []
+
+    def add(self, rect, key=None):
+        """
+        Record a region drawn this frame.
+        """
+        self._current.append((pygame.Rect(rect), key))
+
+    def add_all(self, rects):
+        """
+        Record several regions drawn this frame.
+        """
+        for rect in rects:
+            self.add(rect)
+
+    def present(self):
+        """
+        Push the changed regions (or the whole frame) to the display.
+        """
+        if self._full_redraw:
+            pygame.display.flip()
+            self._full_redraw = False
+        else:
+            previous = {(tuple(r), k) for r, k in self._previous if k is not None}
+            current = {(tuple(r), k) for r, k in self._current if k is not None}
+            dirty = [
+                rect
+                for rect, key in self._current
+                if key is None or (tuple(rect), key) not in previous
+            ]
+            dirty += [
+                rect
+                for rect, key in self._previous
+                if key is None or (tuple(rect), key) not in current
+            ]
+            if dirty:
+                pygame.display.update(dirty)
+        self._previous = self._current
@@ -0,0 +1,327 @@
+"""
+scenes.py
+
+Defines a scene for each game state, holding its key bindings and drawing.
+"""
+
+import pygame
+import sys
+from config.settings import (
+    SCREEN_WIDTH,
+    SCREEN_HEIGHT,
+    SCI_FI_GREEN,
+    SCI_FI_BLUE,
+    WHITE,
+    FONT_NAME,
+    FONT_SIZE,
+    FONT_SMALL_SIZE,
+    SHIELD_DURATION,
+    DIFFICULTY_LEVELS,
+    PROFILES,
+)
+from game.state import STATE_START, STATE_LEVEL_SELECT, STATE_PLAYING, STATE_GAME_OVER
+from utils.assets import assets
+from utils.text_cache import text_cache
+from utils.profiler import profiler
+
+
+class Scene:
+    """
+    The input handling and drawing of one game state.
+
+    keymap maps pygame key codes to handlers, called as
+    handler(key, bird, game_state, backgrounds, audio). Every scene
+    quits on Q. Scenes with attract set show the attract-mode demo behind
+    them.
+    """
+
+    attract = False
+
+    def __init__(self) -> None:
+        self.keymap = {pygame.K_q: self.quit}
+
+    def handle_key(self, key, bird, game_state, backgrounds, audio):
+        """
+        Dispatch a key press to its handler, if the scene binds it.
+        """
+        handler = self.keymap.get(key)
+        if handler is not None:
+            handler(key, bird, game_state, backgrounds, audio)
+
+    def quit(self, key, bird, game_state, backgrounds, audio):
+        """
+        Close the game.
+        """
+        pygame.quit()
+        sys.exit()
+
+    def draw(
+        self, screen, renderer, bird, obstacles, particles, powerups, game_state, alpha
+    ):
+        """
+        Draw the scene over the background.
+        """
+
+
+class StartScene(Scene):
+    """
+    The title screen, where a theme is chosen.
+    """
+
+    attract = True
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.themes = {ord(theme.key): theme for theme in PROFILES.themes.values()}
+        self.keymap.update(dict.fromkeys(self.themes, self.choose_theme))
+        self.prompt = "Press " + ", ".join(
+            f"{theme.key.upper()} for {theme.name.title()}"
+            for theme in PROFILES.themes.values()
+        )
+
+    def choose_theme(self, key, bird, game_state, backgrounds, audio):
+        """
+        Switch to the chosen theme and move on to the difficulty choice.
+        """
+        theme = self.themes[key].name
+        game_state.theme = theme
+        game_state.current_background = backgrounds[theme]
+        game_state.state = STATE_LEVEL_SELECT
+
+    def draw(
+        self, screen, renderer, bird, obstacles, particles, powerups, game_state, alpha
+    ):
+        draw_demo(screen, renderer, game_state, alpha)
+        font = assets.font(FONT_NAME, FONT_SIZE)
+        small_font = assets.font(FONT_NAME, FONT_SMALL_SIZE)
+        title_text = text_cache.render(font, "Sci-Fi Flappy Bird", True, SCI_FI_GREEN)
+        theme_text = text_cache.render(small_font, self.prompt, True, SCI_FI_BLUE)
+        quit_text = text_cache.render(small_font, "Press Q to Quit", True, SCI_FI_GREEN)
+        draw_centered(screen, renderer, title_text, SCREEN_HEIGHT // 3)
+        draw_centered(screen, renderer, theme_text, SCREEN_HEIGHT // 2)
+        draw_centered(screen, renderer, quit_text, SCREEN_HEIGHT // 2 + 30)
+
+
+class LevelSelectScene(Scene):
+    """
+    The difficulty choice that starts a game.
+    """
+
+    attract = True
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.difficulties = {
+            ord(difficulty.key): difficulty for difficulty in DIFFICULTY_LEVELS.values()
+        }
+        self.keymap.update(dict.fromkeys(self.difficulties, self.choose_difficulty))
+        self.prompt = "Press " + ", ".join(
+            f"{difficulty.key.upper()} for {difficulty.name.title()}"
+            for difficulty in DIFFICULTY_LEVELS.values()
+        )
+
+    def choose_difficulty(self, key, bird, game_state, backgrounds, audio):
+        """
+        Start playing at the chosen difficulty.
+        """
+        difficulty = self.difficulties[key]
+        game_state.level = difficulty.name
+        game_state.gravity = difficulty.gravity
+        game_state.flap_strength = difficulty.flap_strength
+        game_state.state = STATE_PLAYING
+        game_state.start_time = pygame.time.get_ticks()
+        bird.gravity = difficulty.gravity
+        bird.flap_strength = difficulty.flap_strength
+
+    def draw(
+        self, screen, renderer, bird, obstacles, particles, powerups, game_state, alpha
+    ):
+        draw_demo(screen, renderer, game_state, alpha)
+        font = assets.font(FONT_NAME, FONT_SIZE)
+        small_font = assets.font(FONT_NAME, FONT_SMALL_SIZE)
+        title_text = text_cache.render(font, "Select Difficulty", True, SCI_FI_GREEN)
+        instruction_text = text_cache.render(small_font, self.prompt, True, SCI_FI_BLUE)
+        quit_text = text_cache.render(small_font, "Press Q to Quit", True, SCI_FI_GREEN)
+        draw_centered(screen, renderer, title_text, SCREEN_HEIGHT // 3)
+        draw_centered(screen, renderer, instruction_text, SCREEN_HEIGHT // 2)
+        draw_centered(screen, renderer, quit_text, SCREEN_HEIGHT // 2 + 30)
+
+
+class PlayingScene(Scene):
+    """
+    The game in progress.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.keymap[pygame.K_SPACE] = self.flap
+        self.keymap[pygame.K_g] = self.shield
+
+    def flap(self, key, bird, game_state, backgrounds, audio):
+        """
+        Flap the bird's wings.
+        """
+        bird.flap()
+        audio.play("flap")
+
+    def shield(self, key, bird, game_state, backgrounds, audio):
+        """
+        Enable the shield cheat.
+        """
+        bird.shield = True
+        bird.shield_timer = SHIELD_DURATION
+
+    def draw(
+        self, screen, renderer, bird, obstacles, particles, powerups, game_state, alpha
+    ):
+        font = assets.font(FONT_NAME, FONT_SIZE)
+        small_font = assets.font(FONT_NAME, FONT_SMALL_SIZE)
+
+        draw_world(
+            screen, renderer, bird, obstacles, particles, powerups, game_state, alpha
+        )
+
+        # Ensure start time isn't None
+        if game_state.start_time is None:
+            game_state.start_time = pygame.time.get_ticks()
+
+        # Calculate elapsed time
+        elapsed_time_sec = (pygame.time.get_ticks() - game_state.start_time) // 1000
+
+        # Format the time as HH:MM:SS
+        hours, remainder = divmod(elapsed_time_sec, 3600)
+        minutes, seconds = divmod(remainder, 60)
+        time_display = f"Time: {int(hours):02}:{int(minutes):02}:{int(seconds):02}"
+
+        # Draw time played, 10 pixels from the top-right corner
+        time_text = text_cache.render(small_font, time_display, True, WHITE)
+        text_rect = time_text.get_rect()
+        text_rect.topright = (SCREEN_WIDTH - 10, 10)
+        draw_label(screen, renderer, time_text, text_rect)
+
+        # Draw score
+        score_text = text_cache.render(font, str(game_state.score), True, WHITE)
+        draw_centered(screen, renderer, score_text, 50)
+
+        # Show the time left on an active shield
+        if bird.shield:
+            shield_seconds_left = bird.shield_timer // 60
+            shield_seconds_left_text = text_cache.render(
+                small_font,
+                f"Shield active for {shield_seconds_left:02} s",
+                True,
+                SCI_FI_GREEN,
+            )
+            draw_label(screen, renderer, shield_seconds_left_text, (10, 10))
+
+
+class GameOverScene(Scene):
+    """
+    The results of the finished game.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.keymap[pygame.K_r] = self.retry
+
+    def retry(self, key, bird, game_state, backgrounds, audio):
+        """
+        Ask the game loop to start a new game.
+        """
+        game_state.reset = True
+
+    def draw(
+        self, screen, renderer, bird, obstacles, particles, powerups, game_state, alpha
+    ):
+        font = assets.font(FONT_NAME, FONT_SIZE)
+        small_font = assets.font(FONT_NAME, FONT_SMALL_SIZE)
+        game_over_text = text_cache.render(font, "Game Over", True, SCI_FI_GREEN)
+        score_text = text_cache.render(
+            font, "Score: " + str(game_state.score), True, SCI_FI_BLUE
+        )
+        high_score_text = text_cache.render(
+            small_font, "Highest Score: " + str(game_state.high_score), True, WHITE
+        )
+        leaderboard_text = text_cache.render(
+            small_font,
+            "Top Scores: " + "  ".join(map(str, game_state.leaderboard)),
+            True,
+            WHITE,
+        )
+        retry_text = text_cache.render(
+            small_font, "Press R to Retry or Q to Quit", True, SCI_FI_GREEN
+        )
+        draw_centered(screen, renderer, game_over_text, SCREEN_HEIGHT // 3)
+        draw_centered(screen, renderer, score_text, SCREEN_HEIGHT // 2)
+        draw_centered(screen, renderer, high_score_text, SCREEN_HEIGHT // 2 + 40)
+        draw_centered(screen, renderer, leaderboard_text, SCREEN_HEIGHT // 2 + 70)
+        draw_centered(screen, renderer, retry_text, SCREEN_HEIGHT // 2 + 110)
+
+
+# The pipe colour of each theme
+PIPE_COLORS = {name: theme.pipe_color for name, theme in PROFILES.themes.items()}
+
+
+def draw_world(
+    screen, renderer, bird, obstacles, particles, powerups, game_state, alpha
+):
+    """
+    Draws the obstacles (in the theme's pipe colour), power-ups, bird and
+    particles.
+    """
+    with profiler.section("draw.obstacles"):
+        pipe_color = PIPE_COLORS.get(game_state.theme)
+        for obstacle in obstacles:
+            renderer.add_all(obstacle.draw(screen, alpha, pipe_color))
+    with profiler.section("draw.powerups"):
+        for powerup in powerups:
+            renderer.add(powerup.draw(screen, alpha))
+    with profiler.section("draw.bird"):
+        renderer.add(bird.draw(screen, alpha))
+    with profiler.section("draw.particles"):
+        renderer.add_all(particles.draw(screen, alpha))
+
+
+def draw_demo(screen, renderer, game_state, alpha):
+    """
+    Draws the attract-mode demo game, once it has started.
+    """
+    demo = game_state.demo
+    if demo is not None and demo.started:
+        sim = demo.sim
+        draw_world(
+            screen,
+            renderer,
+            sim.bird,
+            sim.obstacles,
+            demo.particles,
+            sim.powerups,
+            game_state,
+            alpha,
+        )
+
+
+def draw_label(screen, renderer, surface, position):
+    """
+    Blits a text label and records it with the renderer, keyed by its cached
+    surface so an unchanged label is not pushed to the display again.
+    """
+    renderer.add(screen.blit(surface, position), surface)
+
+
+def draw_centered(screen, renderer, surface, y):
+    """
+    Draws a text label centred horizontally with its top at y.
+    """
+    draw_label(
+        screen, renderer, surface, (SCREEN_WIDTH // 2 - surface.get_width() // 2, y)
+    )
+
+
+# The scene of each game state
+SCENES = {
+    STATE_START: StartScene(),
+    STATE_LEVEL_SELECT: LevelSelectScene(),
+    STATE_PLAYING: PlayingScene(),
+    STATE_GAME_OVER: GameOverScene(),
+}
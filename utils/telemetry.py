@@ -0,0 +1,225 @@
+"""
+telemetry.py
+
+Samples frame times, entity counts, memory and garbage collection over long
+sessions and logs them, with game-over records, to rotating compressed files.
+"""
+
+import gc
+import gzip
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from config.settings import (
+    TELEMETRY_INTERVAL,
+    TELEMETRY_BUFFER,
+    TELEMETRY_FILE_BYTES,
+    TELEMETRY_MAX_FILES,
+)
+from utils.profiler import PERCENTILES
+
+LOG_PREFIX = "telemetry-"
+LOG_SUFFIX = ".jsonl.gz"
+
+
+def memory_kb() -> int:
+    """
+    Return the resident memory of the process in kilobytes: the current size
+    where /proc is available, otherwise the peak so far.
+    """
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except OSError:
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak // 1024 if sys.platform == "darwin" else peak
+
+
+class Telemetry:
+    """
+    Collects telemetry for a session and hands it to a writer thread.
+
+    Frame times go into a ring buffer of TELEMETRY_INTERVAL frames; each time
+    it fills, one sample record is made from it (frame time percentiles) and
+    from the entity counts, resident memory and garbage collections at that
+    moment. Records wait for the writer in a queue of at most TELEMETRY_BUFFER
+    entries, dropping the oldest if the disk falls behind, so memory use stays
+    fixed however long the session runs. The writer appends JSON lines to
+    gzip files in the log directory, starting a new file every
+    TELEMETRY_FILE_BYTES and deleting the oldest beyond TELEMETRY_MAX_FILES.
+
+    Until open() is called every method returns at once.
+    """
+
+    def __init__(self, interval: int = TELEMETRY_INTERVAL) -> None:
+        self.interval = interval
+        self.enabled = False
+        self.session = None
+        self.dropped = 0
+        self._frame_times = [0.0] * interval
+        self._frames = 0
+        self._gc_collections = None
+        self._records = deque(maxlen=TELEMETRY_BUFFER)
+        self._ready = threading.Condition()
+        self._closing = False
+        self._thread = None
+        self._directory = None
+
+    def open(self, directory: str, **details) -> None:
+        """
+        Start a session logging to directory. details (such as the seed) are
+        stored in the session's first record.
+        """
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self.session = time.strftime("%Y%m%d-%H%M%S")
+        self._frames = 0
+        self._gc_collections = self._collections()
+        self._closing = False
+        self.enabled = True
+        self._thread = threading.Thread(
+            target=self._write_loop, name="telemetry-writer", daemon=True
+        )
+        self._thread.start()
+        self._put({"type": "session_start", "rss_kb": memory_kb(), **details})
+
+    def end_frame(self, frame_time: float, obstacles, particles, powerups) -> None:
+        """
+        Record the seconds one frame took, and make a sample record each time
+        the ring buffer fills.
+        """
+        if not self.enabled:
+            return
+        index = self._frames % self.interval
+        self._frame_times[index] = frame_time
+        self._frames += 1
+        if index == self.interval - 1:
+            self._sample(obstacles, particles, powerups)
+
+    def game_over(self, game_state) -> None:
+        """
+        Log a finished game.
+        """
+        if not self.enabled:
+            return
+        self._put(
+            {
+                "type": "game_over",
+                "theme": game_state.theme,
+                "level": game_state.level,
+                "score": game_state.score,
+                "frames": game_state.frame_count,
+                "cause_of_death": game_state.cause_of_death,
+            }
+        )
+
+    def close(self) -> None:
+        """
+        Log the end of the session, write out every queued record and stop
+        the writer thread.
+        """
+        if not self.enabled:
+            return
+        self._put({"type": "session_end", "frames": self._frames})
+        self.enabled = False
+        with self._ready:
+            self._closing = True
+            self._ready.notify()
+        self._thread.join()
+        self._thread = None
+
+    def _collections(self):
+        return [stats["collections"] for stats in gc.get_stats()]
+
+    def _sample(self, obstacles, particles, powerups) -> None:
+        times = sorted(self._frame_times)
+        frame_ms = {"mean": sum(times) / len(times) * 1000, "max": times[-1] * 1000}
+        for percentile in PERCENTILES:
+            index = round(percentile / 100 * (len(times) - 1))
+            frame_ms[f"p{percentile}"] = times[index] * 1000
+        collections = self._collections()
+        gc_collections = [
+            now - before for now, before in zip(collections, self._gc_collections)
+        ]
+        self._gc_collections = collections
+        self._put(
+            {
+                "type": "sample",
+                "frame": self._frames,
+                "frame_ms": frame_ms,
+                "obstacles": len(obstacles),
+                "particles": len(particles),
+                "powerups": len(powerups),
+                "rss_kb": memory_kb(),
+                "gc_collections": gc_collections,
+                "dropped": self.dropped,
+            }
+        )
+
+    def _put(self, record: dict) -> None:
+        record = {"time": time.time(), "session": self.session, **record}
+        with self._ready:
+            if len(self._records) == self._records.maxlen:
+                self.dropped += 1
+            self._records.append(record)
+            self._ready.notify()
+
+    def _write_loop(self) -> None:
+        """
+        Write queued records until close() is called.
+        """
+        log, written, part = None, 0, 0
+        while True:
+            with self._ready:
+                while not self._records and not self._closing:
+                    self._ready.wait()
+                records = list(self._records)
+                self._records.clear()
+                closing = self._closing
+            if records:
+                if log is None or written >= TELEMETRY_FILE_BYTES:
+                    if log is not None:
+                        log.close()
+                    part += 1
+                    log, written = self._new_log(part), 0
+                data = "".join(json.dumps(record) + "\n" for record in records)
+                log.write(data.encode())
+                # Keep what is written so far readable if the kiosk loses power
+                log.flush()
+                written += len(data)
+            if closing:
+                break
+        if log is not None:
+            log.close()
+
+    def _new_log(self, part: int):
+        """
+        Open the next log file of the session, deleting the oldest logs
+        beyond TELEMETRY_MAX_FILES.
+        """
+        logs = log_files(self._directory)
+        for path in logs[: max(0, len(logs) - TELEMETRY_MAX_FILES + 1)]:
+            os.remove(path)
+        name = f"{LOG_PREFIX}{self.session}-{part:04}{LOG_SUFFIX}"
+        return gzip.open(os.path.join(self._directory, name), "wb")
+
+
+def log_files(directory: str) -> list:
+    """
+    Return the telemetry logs in directory, oldest first.
+    """
+    names = sorted(
+        name
+        for name in os.listdir(directory)
+        if name.startswith(LOG_PREFIX) and name.endswith(LOG_SUFFIX)
+    )
+    return [os.path.join(directory, name) for name in names]
+
+
+# Shared telemetry used by the game loop
+telemetry = Telemetry()
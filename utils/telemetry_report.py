@@ -0,0 +1,141 @@
+"""
+telemetry_report.py
+
+Summarizes telemetry logs offline, flagging memory leaks and frame time drift
+within each session. Run from the project root:
+
+    python -m utils.telemetry_report telemetry/
+"""
+
+import argparse
+import gzip
+import json
+import sys
+from utils.telemetry import log_files
+
+LEAK_KB_PER_HOUR = 1024  # Resident memory growth flagged as a leak
+DRIFT_MS_PER_HOUR = 1.0  # p95 frame time growth flagged as drift
+SETTLE_FRACTION = 0.25  # Leading share of samples skipped while caches fill
+MIN_HOURS = 0.25  # Shorter sessions are summarized but never flagged
+
+
+def read_records(directory: str):
+    """
+    Yield every record in the logs in directory, oldest first. A log cut off
+    mid-write (by a crash or power loss) yields the records before the cut.
+    """
+    for path in log_files(directory):
+        with gzip.open(path, "rt") as log:
+            try:
+                for line in log:
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        break
+            except (EOFError, OSError):
+                print(f"{path}: truncated", file=sys.stderr)
+
+
+def slope(points) -> float:
+    """
+    Return the least squares slope of (x, y) points, 0 with fewer than two.
+    """
+    if len(points) < 2:
+        return 0.0
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    spread = sum((x - mean_x) ** 2 for x, _ in points)
+    if not spread:
+        return 0.0
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
+
+
+def summarize(records) -> dict:
+    """
+    Summarize one session's records: its length, games, entity peaks and
+    garbage collection, and the memory and p95 frame time trends per hour
+    after the first SETTLE_FRACTION of samples.
+    """
+    samples = [record for record in records if record["type"] == "sample"]
+    games = [record for record in records if record["type"] == "game_over"]
+    start = records[0]["time"]
+    hours = (records[-1]["time"] - start) / 3600
+    settled = samples[int(len(samples) * SETTLE_FRACTION) :]
+    summary = {
+        "hours": hours,
+        "samples": len(samples),
+        "games": len(games),
+        "best_score": max((game["score"] for game in games), default=0),
+        "dropped": samples[-1]["dropped"] if samples else 0,
+        "rss_kb": (samples[0]["rss_kb"], samples[-1]["rss_kb"]) if samples else None,
+        "leak_kb_per_hour": slope(
+            [((s["time"] - start) / 3600, s["rss_kb"]) for s in settled]
+        ),
+        "drift_ms_per_hour": slope(
+            [((s["time"] - start) / 3600, s["frame_ms"]["p95"]) for s in settled]
+        ),
+        "max_frame_ms": max((s["frame_ms"]["max"] for s in samples), default=0.0),
+        "gc_full_per_hour": (
+            sum(s["gc_collections"][-1] for s in samples) / hours if hours else 0.0
+        ),
+    }
+    for kind in ("obstacles", "particles", "powerups"):
+        summary[f"max_{kind}"] = max((s[kind] for s in samples), default=0)
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Summarize telemetry logs and flag leaks and frame time drift."
+    )
+    parser.add_argument("directory")
+    parser.add_argument("--leak-kb", type=float, default=LEAK_KB_PER_HOUR)
+    parser.add_argument("--drift-ms", type=float, default=DRIFT_MS_PER_HOUR)
+    args = parser.parse_args()
+
+    sessions = {}
+    for record in read_records(args.directory):
+        sessions.setdefault(record["session"], []).append(record)
+    if not sessions:
+        print(f"no telemetry in {args.directory}")
+        sys.exit(1)
+
+    flagged = 0
+    for session, records in sessions.items():
+        summary = summarize(records)
+        print(
+            f"{session}  {summary['hours']:.2f} h  {summary['games']} games  "
+            f"best {summary['best_score']}  {summary['samples']} samples  "
+            f"{summary['dropped']} dropped"
+        )
+        if summary["rss_kb"]:
+            first, last = summary["rss_kb"]
+            print(
+                f"  memory   {first} -> {last} KB  "
+                f"{summary['leak_kb_per_hour']:+.0f} KB/h"
+            )
+        print(
+            f"  frames   p95 {summary['drift_ms_per_hour']:+.3f} ms/h  "
+            f"worst {summary['max_frame_ms']:.1f} ms"
+        )
+        print(
+            f"  peaks    {summary['max_obstacles']} obstacles  "
+            f"{summary['max_particles']} particles  "
+            f"{summary['max_powerups']} power-ups  "
+            f"{summary['gc_full_per_hour']:.0f} full collections/h"
+        )
+        if summary["hours"] < MIN_HOURS:
+            print("  too short to judge trends")
+            continue
+        if summary["leak_kb_per_hour"] > args.leak_kb:
+            print("  LEAK: memory keeps growing")
+            flagged += 1
+        if summary["drift_ms_per_hour"] > args.drift_ms:
+            print("  DRIFT: frames keep getting slower")
+            flagged += 1
+    if flagged:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+text_cache.py
+
+Caches rendered text surfaces so unchanged labels are not rasterized again.
+"""
+
+from collections import OrderedDict
+
+
+class TextCache:
+    """
+    A least-recently-used cache of rendered text surfaces keyed by
+    (font, text, color, antialias).
+    """
+
+    def __init__(self, max_size: int = 128) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._surfaces = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    def render(self, font, text: str, antialias: bool, color):
+        """
+        Return the rendered surface for text, rendering it only on a miss.
+        Takes the same arguments as font.render, with the font first.
+        """
+        key = (font, text, color, antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_size:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self) -> None:
+        """
+        Drop every cached surface and reset the counters.
+        """
+        self._surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# Shared cache used by the HUD and menu screens
+text_cache = TextCache()
@@ -0,0 +1,45 @@
+"""
+timestep.py
+
+Converts real elapsed time into a whole number of fixed simulation steps.
+"""
+
+
+class FixedTimestep:
+    """
+    An accumulator-based fixed-timestep clock.
+
+    Real time is added to an accumulator and consumed in steps of 1 / step_rate
+    seconds, so the simulation runs at the same speed whatever the render
+    frame rate. What is left over (alpha, from 0 to 1) tells the renderer how
+    far to interpolate between the last two simulation steps.
+    """
+
+    def __init__(self, step_rate: int, max_steps: int) -> None:
+        self.step_time = 1 / step_rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.dropped_time = 0.0  # Seconds skipped by the spiral-of-death guard
+
+    def advance(self, elapsed: float) -> int:
+        """
+        Add elapsed seconds and return how many steps to simulate now.
+        """
+        self.accumulator += elapsed
+        steps = int(self.accumulator / self.step_time)
+        if steps > self.max_steps:
+            # Spiral-of-death guard: when the simulation cannot keep up, drop
+            # the backlog instead of trying to catch up on it
+            self.dropped_time += (steps - self.max_steps) * self.step_time
+            self.accumulator %= self.step_time
+            return self.max_steps
+        self.accumulator -= steps * self.step_time
+        return steps
+
+    @property
+    def alpha(self) -> float:
+        """
+        How far real time has moved past the last step, as a fraction of a
+        step.
+        """
+        return self.accumulator / self.step_time